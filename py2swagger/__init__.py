@@ -1,15 +1,23 @@
+__version__ = '1.0.0'
+
 import argparse
-import codecs
 import logging
 import os
 import sys
-import json
+import threading
+import time
 
 from yapsy.PluginManager import PluginManager
 
+from .cache import DiskDocstringCache, docstring_cache
 from .plugins import Py2SwaggerPlugin, Py2SwaggerPluginException
 from .schema_builder import SchemaBuilder
+from .server import CachedSchema, parse_address, reset_build_state, serve
+from .sharding import SHARD_BY, write_shards
+from .stats import stats
 from .utils import get_settings, update_settings
+from .watch import watch
+from .writer import FORMATS, write_gzip_copy, write_schema
 
 
 logging.basicConfig(level=logging.INFO)
@@ -31,12 +39,41 @@ def run():  # pragma: no cover
         directories_list=[os.path.join(os.path.dirname(__file__), 'plugins')],
         plugin_info_ext='py2swagger'
     )
+    plugin_discovery_start = time.time()
     plugin_manager.collectPlugins()
+    plugin_discovery_time = time.time() - plugin_discovery_start
 
     parser = argparse.ArgumentParser(description='Swagger schema builder')
     parser.add_argument('-c', '--config', action='store', dest='config', help='Path to config file')
     parser.add_argument('-r', '--root', action='store', dest='root', help='Path to project root. Default is current directory or configuration file location')
     parser.add_argument('-o', '--output', action='store', dest='output', help='Output file (Default stdout)')
+    parser.add_argument('--cache-dir', action='store', dest='cache_dir',
+                        help='Directory to persist parsed docstrings between runs')
+    parser.add_argument('--cache-size', action='store', dest='cache_size', type=int, default=docstring_cache.maxsize,
+                        help='Maximum number of cached docstrings. Default is {}'.format(docstring_cache.maxsize))
+    parser.add_argument('--no-cache', action='store_true', dest='no_cache', help='Disable docstrings cache')
+    parser.add_argument('--preparse', action='store', dest='preparse', type=int, metavar='WORKERS',
+                        help='Parse all docstrings in worker processes before introspection. '
+                             'Use 0 to start worker per CPU')
+    parser.add_argument('--stats', action='store_true', dest='stats',
+                        help='Print phases timings and counters to stderr')
+    parser.add_argument('--stream', action='store_true', dest='stream',
+                        help='Write schema by parts instead of encoding it entirely in memory')
+    parser.add_argument('--format', action='store', dest='format', choices=FORMATS, default='json',
+                        help='Output format. "compact" is JSON without indentation, '
+                             '"gzip" is gzip-compressed compact JSON. Default is json')
+    parser.add_argument('--gzip', action='store_true', dest='gzip',
+                        help='Write gzip-compressed copy of output file next to it')
+    parser.add_argument('--shard-by', action='store', dest='shard_by', choices=SHARD_BY,
+                        help='Split paths by first tag or first path segment into separate files '
+                             'with shared definitions file and index. Output is used as directory')
+    parser.add_argument('--watch', action='store_true', dest='watch',
+                        help='Regenerate schema on changes of project files')
+    parser.add_argument('--watch-interval', action='store', dest='watch_interval', type=float, default=1.0,
+                        metavar='SECONDS', help='Project files polling interval. Default is 1 second')
+    parser.add_argument('--serve', action='store', dest='serve', metavar='[HOST:]PORT',
+                        help='Serve schema over HTTP instead of writing it. POST /reload rebuilds schema, '
+                             'use with --watch to rebuild it on changes of project files')
 
     sub_parsers = parser.add_subparsers(title='plugins', dest='plugin')
 
@@ -49,31 +86,128 @@ def run():  # pragma: no cover
 
     args = parser.parse_args()
 
-    sys.path.append(_get_project_root_path(args.root, args.config))
+    if args.gzip and not args.output:
+        parser.error('--gzip requires --output')
+    if args.gzip and args.format == 'gzip':
+        parser.error('--gzip could not be used with gzip format')
+    if args.shard_by and not args.output:
+        parser.error('--shard-by requires --output')
+    if args.serve:
+        try:
+            parse_address(args.serve)
+        except ValueError as e:
+            parser.error(str(e))
+
+    stats.enabled = args.stats
+    stats.add_time('plugin discovery', plugin_discovery_time)
 
-    swagger_settings, plugin_settings = get_settings(args.config)
+    project_root_path = _get_project_root_path(args.root, args.config)
+    sys.path.append(project_root_path)
 
     plugin = plugin_manager.getPluginByName(args.plugin, category='py2swagger')
     if not plugin:
         sys.stderr.write('Plugin not available\n')
         sys.exit(1)
 
+    disk_cache = None
+    if args.no_cache:
+        docstring_cache.maxsize = 0
+    else:
+        docstring_cache.maxsize = args.cache_size
+        if args.cache_dir:
+            disk_cache = DiskDocstringCache(args.cache_dir)
+            disk_cache.load()
+
+    def build():
+        builder = build_schema(plugin.plugin_object, args)
+
+        if disk_cache is not None:
+            disk_cache.save()
+
+        write_output(builder.schema, args)
+
+        if stats.enabled:
+            stats.set('definitions', len(builder.schema['definitions']))
+            stats.set('definition conflicts', len(builder.conflicts))
+            stats.set('docstring cache hits', docstring_cache.hits)
+            stats.set('docstring cache misses', docstring_cache.misses)
+            sys.stderr.write(stats.report())
+
+    def rebuild():
+        if args.serve:
+            # the same rebuild as on POST /reload
+            cached_schema.rebuild()
+        else:
+            # reloaded modules define new classes
+            reset_build_state()
+            build()
+
+    def build_served():
+        builder = build_schema(plugin.plugin_object, args)
+        if disk_cache is not None:
+            disk_cache.save()
+        return builder.schema
+
     try:
-        swagger_settings_part = plugin.plugin_object.run(args, **plugin_settings)
+        if args.serve:
+            cached_schema = CachedSchema(build_served)
+            if args.watch:
+                watch_thread = threading.Thread(target=watch, args=(rebuild, project_root_path, args.watch_interval))
+                watch_thread.daemon = True
+                watch_thread.start()
+            serve(cached_schema, args.serve)
+        else:
+            build()
+            if args.watch:
+                watch(rebuild, project_root_path, args.watch_interval)
     except Py2SwaggerPluginException as e:
         sys.stderr.write('{}\n'.format(e))
         sys.exit(1)
+    except KeyboardInterrupt:
+        pass
+
+
+def build_schema(plugin, arguments):
+    """
+    Builds schema with plugin
+
+    :param Py2SwaggerPlugin plugin: plugin object
+    :param argparse.Namespace arguments: command line arguments
+    :return: schema builder with generated schema
+    :rtype: SchemaBuilder
+    """
+    swagger_settings, plugin_settings = get_settings(arguments.config)
+    swagger_settings_part = plugin.run(arguments, **plugin_settings)
 
     swagger_settings = update_settings(swagger_settings, swagger_settings_part)
     builder = SchemaBuilder(**swagger_settings)
 
-    swagger_schema = json.dumps(builder.schema, indent=2)
-    if args.output:
-        with codecs.open(args.output, 'wb', encoding='utf-8') as f:
-            f.write(swagger_schema)
-    else:
-        sys.stdout.write(swagger_schema)
-
+    with stats.timer('schema generation'):
+        builder.schema
+
+    return builder
+
+
+def write_output(schema, arguments):
+    """
+    Writes schema as requested by command line arguments
+
+    :param dict schema: swagger schema
+    :param argparse.Namespace arguments: command line arguments
+    """
+    with stats.timer('serialization'):
+        if arguments.shard_by:
+            write_shards(schema, arguments.output, arguments.shard_by, arguments.format, arguments.stream,
+                         arguments.gzip)
+        elif arguments.output:
+            with open(arguments.output, 'wb') as f:
+                write_schema(schema, f, arguments.format, arguments.stream)
+            if arguments.gzip:
+                write_gzip_copy(arguments.output)
+        else:
+            stream = getattr(sys.stdout, 'buffer', sys.stdout)
+            write_schema(schema, stream, arguments.format, arguments.stream)
+            stream.flush()
 
 if __name__ == '__main__':
     run()
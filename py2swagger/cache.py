@@ -0,0 +1,259 @@
+import glob
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from copy import deepcopy
+
+import six
+import yaml
+
+from . import __version__
+from .utils import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+class DocstringCache(object):
+    """
+    Process-wide LRU cache for parsed docstrings
+
+    Entries are keyed by hash of raw docstring text. Values are copied
+    on write and on read, so callers are free to mutate returned objects.
+    """
+
+    def __init__(self, maxsize=10000):
+        """
+        :param int maxsize: maximum number of entries. 0 disables caching
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, docstring):
+        return self.make_key(docstring) in self._entries
+
+    @staticmethod
+    def make_key(docstring):
+        """
+        :param str docstring: raw docstring
+        :return: docstring content hash
+        :rtype: str
+        """
+        if isinstance(docstring, six.text_type):
+            docstring = docstring.encode('utf-8')
+        return hashlib.sha1(docstring).hexdigest()
+
+    def get(self, docstring):
+        """
+        Get parsed docstring
+
+        :param str docstring: raw docstring
+        :return: copy of cached value or None
+        """
+        key = self.make_key(docstring)
+        try:
+            value = self._entries.pop(key)
+        except KeyError:
+            self.misses += 1
+            return None
+
+        # move entry to the end as most recently used
+        self._entries[key] = value
+        self.hits += 1
+        return deepcopy(value)
+
+    def set(self, docstring, value):
+        """
+        Store parsed docstring
+
+        :param str docstring: raw docstring
+        :param value: parse result
+        """
+        if self.maxsize <= 0:
+            return
+
+        self._store(self.make_key(docstring), deepcopy(value))
+
+    def _store(self, key, value):
+        self._entries.pop(key, None)
+        self._entries[key] = value
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def items(self):
+        """
+        :return: (key, value) pairs from least to most recently used
+        :rtype: list
+        """
+        return list(self._entries.items())
+
+    def update(self, items):
+        """
+        Seed cache with (key, value) pairs, e.g. loaded from disk.
+        Values are stored as is, without copying
+
+        :param items: iterable of (key, value) pairs
+        """
+        if self.maxsize <= 0:
+            return
+
+        for key, value in items:
+            self._store(key, value)
+
+    def clear(self):
+        """
+        Remove all entries and reset counters
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_JSON_SCALARS = six.string_types + six.integer_types + (float, bool, type(None))
+_TUPLE_TAG = '__tuple__'
+_PAIRS_TAG = '__pairs__'
+
+
+def _encode(value):
+    """
+    Converts parse result to JSON compatible value. Tuples and mappings with
+    non-string keys (e.g. response codes) are stored as tagged objects
+
+    :param value: parse result
+    :return: JSON compatible value
+    :raises TypeError: value contains types which JSON can't represent, e.g. dates
+    """
+    if isinstance(value, _JSON_SCALARS):
+        return value
+    if isinstance(value, tuple):
+        return {_TUPLE_TAG: [_encode(v) for v in value]}
+    if isinstance(value, list):
+        return [_encode(v) for v in value]
+    if isinstance(value, dict):
+        if all(isinstance(k, six.string_types) for k in value) and not (
+                len(value) == 1 and next(iter(value)) in (_TUPLE_TAG, _PAIRS_TAG)):
+            return OrderedDict((k, _encode(v)) for k, v in value.items())
+
+        pairs = []
+        for k, v in value.items():
+            if not isinstance(k, _JSON_SCALARS):
+                raise TypeError('Unsupported key {!r}'.format(k))
+            pairs.append([k, _encode(v)])
+        return {_PAIRS_TAG: pairs}
+    raise TypeError('Unsupported value {!r}'.format(value))
+
+
+def _decode_object(pairs):
+    """
+    json object_pairs_hook which restores values encoded by _encode
+    """
+    if len(pairs) == 1:
+        key, value = pairs[0]
+        if key == _TUPLE_TAG:
+            return tuple(value)
+        if key == _PAIRS_TAG:
+            return OrderedDict((k, v) for k, v in value)
+    return OrderedDict(pairs)
+
+
+class DiskDocstringCache(object):
+    """
+    Persists DocstringCache entries between runs
+
+    Entries are stored as JSON in single file per py2swagger and PyYAML versions,
+    files of other versions are removed on save. Entries which JSON can't represent
+    (e.g. docstrings with dates) are not persisted.
+    """
+
+    file_prefix = 'docstrings-'
+    file_extension = '.json'
+
+    def __init__(self, cache_dir, cache=None, max_entries=None):
+        """
+        :param str cache_dir: cache directory
+        :param DocstringCache cache: in-memory cache. Default is process-wide cache
+        :param int max_entries: maximum number of persisted entries. Default is cache size
+        """
+        self.cache_dir = cache_dir
+        self.cache = cache if cache is not None else docstring_cache
+        self.max_entries = max_entries
+
+    @property
+    def path(self):
+        """
+        :return: path to cache file for current versions
+        :rtype: str
+        """
+        version = '{}-{}'.format(__version__, yaml.__version__)
+        version_hash = hashlib.sha1(version.encode('utf-8')).hexdigest()[:12]
+        return os.path.join(self.cache_dir, '{}{}{}'.format(self.file_prefix, version_hash, self.file_extension))
+
+    def load(self):
+        """
+        Load persisted entries into in-memory cache
+
+        :return: number of loaded entries
+        :rtype: int
+        """
+        if not os.path.exists(self.path):
+            return 0
+
+        try:
+            with open(self.path) as f:
+                items = [(key, value) for key, value in json.load(f, object_pairs_hook=_decode_object)]
+        except Exception as e:
+            logger.warning('Could not load docstring cache %s: %s', self.path, e)
+            return 0
+
+        self.cache.update(items)
+        return len(items)
+
+    def save(self):
+        """
+        Persist most recently used entries of in-memory cache
+
+        :return: number of saved entries
+        :rtype: int
+        """
+        max_entries = self.max_entries if self.max_entries is not None else self.cache.maxsize
+        items = []
+        for key, value in (self.cache.items()[-max_entries:] if max_entries > 0 else []):
+            try:
+                items.append([key, _encode(value)])
+            except TypeError as e:
+                logger.debug('Docstring %s is not persisted: %s', key, e)
+
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir)
+
+        # write to temporary file first to avoid broken cache on interruption
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(items, f)
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            os.rename(tmp_path, self.path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self._remove_stale_files()
+        return len(items)
+
+    def _remove_stale_files(self):
+        pattern = os.path.join(self.cache_dir, '{}*{}'.format(self.file_prefix, self.file_extension))
+        for path in glob.glob(pattern):
+            if path != self.path:
+                os.remove(path)
+
+
+docstring_cache = DocstringCache()
@@ -1,7 +1,56 @@
 import inspect
+from copy import deepcopy
 
-from .utils import get_mro_list, get_decorators, OrderedDict
-from .yamlparser import YAMLDocstringParser
+from .utils import get_mro_list, get_decorators, memoized_property, materialize, ListLayers, DictLayers
+from .yamlparser import YAMLDocstringParser, EMPTY_PARSER
+
+#: Framework base classes. Their docstrings are skipped while collecting inheritances
+FRAMEWORK_CLASSES = set([object])
+
+
+def register_framework_classes(*classes):
+    """
+    Mark classes as framework base classes
+
+    :param classes: framework classes
+    """
+    FRAMEWORK_CLASSES.update(classes)
+
+
+class IntrospectorRegistry(object):
+    """
+    Process-wide registry of objects derived from introspected classes only,
+    e.g. parsers or whole introspectors which are not depend on view
+    """
+
+    def __init__(self):
+        self._items = {}
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key, factory, *args):
+        """
+        Returns registered object or creates it with factory
+
+        :param key: hashable key, e.g. (introspector class, introspected class)
+        :param factory: callable which creates object
+        :param args: factory arguments
+        """
+        try:
+            return self._items[key]
+        except KeyError:
+            item = self._items[key] = factory(*args)
+            return item
+
+    def clear(self):
+        """
+        Remove all registered objects
+        """
+        self._items.clear()
+
+
+registry = IntrospectorRegistry()
 
 
 class BaseDocstringIntrospector(object):
@@ -12,20 +61,32 @@ class BaseDocstringIntrospector(object):
     - instance base class docstrings
     """
 
+    #: Share parsers of introspected classes between introspectors of the same type
+    shared_parsers = False
+
     def __init__(self, instance):
         """
         :param instance: class or function
         """
         self._instance = instance
 
-        self._parser = self._create_parser(instance)
-        self._inheritances_parser = self._create_parser(self._get_inheritances(instance))
-        self._decorators_parser = self._create_parser(self._get_decorators(instance))
+        if self.shared_parsers and inspect.isclass(instance):
+            self._parsers = registry.get(('parsers', self.__class__, instance), self._create_parsers, instance)
+        else:
+            self._parsers = self._create_parsers(instance)
+
+        self._inheritances_parser, self._decorators_parser, self._parser = self._parsers
 
-        self._parsers = (
-            self._inheritances_parser,
-            self._decorators_parser,
-            self._parser,
+    def _create_parsers(self, instance):
+        """
+        :param instance: class or function
+        :return: inheritances, decorators and instance parsers
+        :rtype: tuple
+        """
+        return (
+            self._create_parser(self._get_inheritances(instance)),
+            self._create_parser(self._get_decorators(instance)),
+            self._create_parser(instance),
         )
 
     @property
@@ -62,7 +123,7 @@ class BaseDocstringIntrospector(object):
         :return: list of objects
         :rtype: list
         """
-        return list(get_mro_list(instance)[::-1])
+        return [cls for cls in get_mro_list(instance)[::-1] if cls not in FRAMEWORK_CLASSES]
 
     @staticmethod
     def _get_decorators(instance):
@@ -78,6 +139,7 @@ class BaseDocstringIntrospector(object):
     def _create_parser(self, instances):
         """
         Creates yaml parser from instance(s)
+        Returns shared empty parser if there are no docstrings
 
         :param list object instances:
         :return: yaml parser
@@ -86,73 +148,88 @@ class BaseDocstringIntrospector(object):
         if not isinstance(instances, (list, tuple)):
             instances = [instances]
 
-        parser = YAMLDocstringParser()
+        parser = EMPTY_PARSER
         for instance in instances:
             doc = self._get_doc(instance)
+            if not doc:
+                continue
+            if parser is EMPTY_PARSER:
+                parser = YAMLDocstringParser()
             parser.update(doc)
         return parser
 
-    @property
+    def _get_layers(self, getter_name, layers_class):
+        """
+        Creates read-only view over values from all parsers
+
+        :param str getter_name: parser getter name
+        :param type layers_class: ListLayers or DictLayers
+        :return: view
+        """
+        return layers_class(getattr(parser, getter_name)() for parser in self._parsers)
+
+    def invalidate(self):
+        """
+        Drops memoized properties values,
+        should be called after parsers or introspected object changes
+        """
+        self.__dict__.pop('_memoized', None)
+
+    def get_copy(self, name):
+        """
+        Returns copy of memoized property value which is safe to change
+
+        :param str name: property name
+        :return: list or OrderedDict
+        """
+        return deepcopy(materialize(getattr(self, name)))
+
+    @memoized_property
     def tags(self):
         """
         Collects tags from all parsers
 
-        :return: parameters
-        :rtype: list
+        :return: read-only tags
+        :rtype: ListLayers
         """
-        tags = []
-        for parser in self._parsers:
-            tags.extend(parser.get_tags())
-        return tags
+        return self._get_layers('get_tags', ListLayers)
 
-    @property
+    @memoized_property
     def parameters(self):
         """
         Collects parameters from all parsers
 
-        :return: parameters
-        :rtype: list
+        :return: read-only parameters
+        :rtype: ListLayers
         """
-        parameters = []
-        for parser in self._parsers:
-            parameters.extend(parser.get_parameters())
-        return parameters
+        return self._get_layers('get_parameters', ListLayers)
 
-    @property
+    @memoized_property
     def responses(self):
         """
         Collects responses from all parsers
 
-        :return: responses
-        :rtype: OrderedDict
+        :return: read-only responses
+        :rtype: DictLayers
         """
-        responses = OrderedDict()
-        for parser in self._parsers:
-            responses.update(parser.get_responses())
-        return responses
+        return self._get_layers('get_responses', DictLayers)
 
-    @property
+    @memoized_property
     def security(self):
         """
         Collects security from all parsers
     
-        :return: security
-        :rtype: list
+        :return: read-only security
+        :rtype: ListLayers
         """
-        security = []
-        for parser in self._parsers:
-            security.extend(parser.get_security())
-        return security
+        return self._get_layers('get_security', ListLayers)
         
-    @property
+    @memoized_property
     def security_definitions(self):
         """
         Collects securityDefinitions from all parsers
     
-        :return: security_definitions
-        :rtype: OrderedDict
+        :return: read-only security_definitions
+        :rtype: DictLayers
         """
-        security_definitions = OrderedDict()
-        for parser in self._parsers:
-            security_definitions.update(parser.get_security_definitions())
-        return security_definitions
+        return self._get_layers('get_security_definitions', DictLayers)
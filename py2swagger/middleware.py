@@ -0,0 +1,116 @@
+import argparse
+import logging
+import threading
+from copy import deepcopy
+
+from .config import SWAGGER_SETTINGS
+from .schema_builder import SchemaBuilder
+from .server import CachedSchema, accepts_gzip, etag_matches
+from .utils import update_settings
+
+logger = logging.getLogger(__name__)
+
+
+class _ArgumentParser(argparse.ArgumentParser):
+
+    def error(self, message):
+        raise ValueError(message)
+
+
+def parse_plugin_arguments(plugin, args=()):
+    """
+    Parses plugin command line arguments, options which are not given get their command line defaults
+
+    :param Py2SwaggerPlugin plugin: plugin object
+    :param list args: plugin command line arguments, e.g. ['project.settings', '--jobs', '4']
+    :rtype: argparse.Namespace
+    """
+    parser = _ArgumentParser(prog=plugin.__class__.__name__)
+    plugin.set_parser_arguments(parser)
+    return parser.parse_args(list(args))
+
+
+def plugin_build(plugin, arguments=None, swagger_settings=None, **plugin_settings):
+    """
+    Creates callable which builds schema with plugin and SchemaBuilder,
+    e.g. plugin_build(SimplePlugin(), endpoints=[(path, method, callback), ...])
+    or plugin_build(DjangoPlugin(), ['project.settings'])
+
+    :param Py2SwaggerPlugin plugin: plugin object
+    :param arguments: plugin command line arguments as list of strings or parsed argparse.Namespace.
+        Required plugin arguments must be given, e.g. django settings module of DjangoPlugin
+    :param dict swagger_settings: settings which override default SWAGGER_SETTINGS
+    :param plugin_settings: plugin settings, the same as PLUGIN_SETTINGS of configuration file
+    :return: callable without arguments which returns schema
+    """
+    if not isinstance(arguments, argparse.Namespace):
+        arguments = parse_plugin_arguments(plugin, arguments or ())
+
+    def build():
+        settings = update_settings(deepcopy(SWAGGER_SETTINGS), deepcopy(swagger_settings or {}))
+        settings = update_settings(settings, plugin.run(arguments, **plugin_settings))
+        return SchemaBuilder(**settings).schema
+
+    return build
+
+
+class SchemaMiddleware(object):
+    """
+    WSGI middleware which serves precomputed schema. Schema is built once,
+    on first request or in background thread started with middleware.
+    Responses support conditional GET and gzip content encoding
+    """
+
+    def __init__(self, app, build, path='/swagger.json', background=False):
+        """
+        :param app: wrapped WSGI application
+        :param build: callable without arguments which returns schema, e.g. plugin_build result,
+            or CachedSchema object
+        :param str path: schema path
+        :param bool background: start building schema in background thread immediately
+        """
+        self.app = app
+        self.path = path
+        self.schema = build if isinstance(build, CachedSchema) else CachedSchema(build)
+
+        if background:
+            thread = threading.Thread(target=self._build)
+            thread.daemon = True
+            thread.start()
+
+    def _build(self):
+        try:
+            self.schema.get()
+        except Exception:
+            # request will try to build schema again
+            logger.exception('Schema build failed')
+
+    def __call__(self, environ, start_response):
+        if environ.get('PATH_INFO') != self.path:
+            return self.app(environ, start_response)
+
+        method = environ.get('REQUEST_METHOD', 'GET')
+        if method not in ('GET', 'HEAD'):
+            start_response('405 Method Not Allowed', [('Allow', 'GET, HEAD'), ('Content-Length', '0')])
+            return []
+
+        content, gzip_content, etag = self.schema.get()
+
+        if etag_matches(environ.get('HTTP_IF_NONE_MATCH'), etag):
+            start_response('304 Not Modified', [('ETag', etag)])
+            return []
+
+        headers = [
+            ('Content-Type', 'application/json'),
+            ('ETag', etag),
+            ('Vary', 'Accept-Encoding'),
+        ]
+        if accepts_gzip(environ.get('HTTP_ACCEPT_ENCODING')):
+            body = gzip_content
+            headers.append(('Content-Encoding', 'gzip'))
+        else:
+            body = content
+        headers.append(('Content-Length', str(len(body))))
+
+        start_response('200 OK', headers)
+        return [body] if method == 'GET' else []
@@ -1,5 +1,7 @@
 from yapsy.IPlugin import IPlugin
 
+from py2swagger.preparse import preparse_docstrings
+
 
 class Py2SwaggerPluginException(Exception):
     pass
@@ -27,3 +29,13 @@ class Py2SwaggerPlugin(IPlugin):
         :rtype: dict
         """
         raise NotImplementedError()
+
+    def preparse(self, arguments, callbacks):
+        """ Parse callbacks docstrings in bulk if it was requested by command line arguments
+
+        :param argparse.Namespace arguments:
+        :param list callbacks: endpoint callbacks
+        """
+        workers = getattr(arguments, 'preparse', None)
+        if workers is not None:
+            preparse_docstrings(callbacks, workers)
@@ -1,15 +1,27 @@
 import os
 
 from py2swagger.plugins import Py2SwaggerPlugin, Py2SwaggerPluginException
+from py2swagger.stats import stats
 
 
 class DjangoPlugin(Py2SwaggerPlugin):
 
     help = 'Plugin for Django REST Framework applications'
 
+    def __init__(self):
+        super(DjangoPlugin, self).__init__()
+        self._manifest = None
+
     def set_parser_arguments(self, parser):
         parser.add_argument('django_settings', help='Path to django settings module')
         parser.add_argument('-f', '--filter', help='Filter urls that contains a pattern')
+        parser.add_argument('--include', action='append', metavar='PATTERN',
+                            help='Include urls matched by glob or regex with "re:" prefix, can be repeated')
+        parser.add_argument('--exclude', action='append', metavar='PATTERN',
+                            help='Exclude urls matched by glob or regex with "re:" prefix, can be repeated')
+        parser.add_argument('--manifest', help='Path to manifest file to reuse operations of unchanged endpoints')
+        parser.add_argument('-j', '--jobs', type=int, default=1,
+                            help='Number of worker processes to introspect endpoints (Default 1)')
 
     def run(self, arguments, *args, **kwargs):
         try:
@@ -17,17 +29,42 @@ class DjangoPlugin(Py2SwaggerPlugin):
                 'DJANGO_SETTINGS_MODULE', arguments.django_settings)
             import django
             if hasattr(django, 'setup'):
-                django.setup()
+                with stats.timer('framework setup'):
+                    django.setup()
         except ImportError:
             raise Py2SwaggerPluginException('Invalid django settings module')
 
         from .introspectors.api import ApiIntrospector
+        from .manifest import Manifest
         from .urlparser import UrlParser
 
         # Patch Djago REST Framework, to make inspection process slightly easier
         from . import injection
 
-        apis = UrlParser().get_apis(filter_path=arguments.filter)
-        a = ApiIntrospector(apis)
+        with stats.timer('url discovery'):
+            apis = UrlParser().get_apis(
+                filter_path=arguments.filter,
+                include=getattr(arguments, 'include', None),
+                exclude=getattr(arguments, 'exclude', None),
+            )
+        self.preparse(arguments, [api['callback'] for api in apis])
+
+        manifest_path = getattr(arguments, 'manifest', None)
+        manifest = self._manifest
+        if manifest is not None:
+            manifest.reset()
+        elif manifest_path or getattr(arguments, 'watch', False):
+            # in watch mode manifest is kept between runs even without file
+            manifest = Manifest(manifest_path)
+            manifest.load()
+            if getattr(arguments, 'watch', False):
+                self._manifest = manifest
+
+        a = ApiIntrospector(apis, manifest, jobs=getattr(arguments, 'jobs', 1))
+
+        with stats.timer('introspection'):
+            swagger_part = a.inspect()
 
-        return a.inspect()
+        if manifest is not None:
+            manifest.save()
+        return swagger_part
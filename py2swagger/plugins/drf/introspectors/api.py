@@ -1,9 +1,16 @@
 import json
+import logging
+import multiprocessing
+import os
+
+import six
 from django.core.serializers.json import DjangoJSONEncoder
 from django.utils.encoding import force_text
 from django.utils.functional import Promise
-from py2swagger.utils import OrderedDict
+from py2swagger.stats import stats
+from py2swagger.utils import OrderedDict, Mapping, Sequence, load_class
 
+from ..manifest import get_class_path
 from .serializer import SerializerIntrospector
 from .view import get_view_introspector
 
@@ -15,13 +22,76 @@ class LazyEncoder(DjangoJSONEncoder):
         return super(LazyEncoder, self).default(obj)
 
 
+logger = logging.getLogger(__name__)
+
+_encoder = LazyEncoder()
+_json_types = six.string_types + six.integer_types + (float, bool, type(None))
+
+
+def _normalize_key(key):
+    if isinstance(key, six.string_types):
+        return key
+    if isinstance(key, Promise):
+        return force_text(key)
+    if isinstance(key, (bool, type(None))):
+        return json.dumps(key)
+    if isinstance(key, float):
+        return float.__repr__(key)
+    return six.text_type(key)
+
+
+def normalize(value):
+    """
+    Returns copy of value which contains JSON types only, the same as json.loads(json.dumps(value, cls=LazyEncoder)):
+    lazy strings, decimals, dates, times and UUIDs become strings, keys become strings and sequences become lists.
+    Copy is required, because operations share objects with docstring parsers and are modified by schema builder
+
+    :param value: operation, definitions or any their part
+    """
+    if isinstance(value, _json_types):
+        return value
+    if isinstance(value, Mapping):
+        return OrderedDict((_normalize_key(k), normalize(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple, Sequence)) and not isinstance(value, six.binary_type):
+        return [normalize(v) for v in value]
+    return normalize(_encoder.default(value))
+
+
+# introspector of parent process, inherited by forked workers
+_worker_introspector = None
+
+
+def _inspect_shard(indices):
+    """
+    Introspects apis of shard in worker process
+
+    :param list indices: indices of apis
+    :return: entries with serializer class paths instead of classes by api index and worker counters
+    :rtype: tuple
+    """
+    stats.reset()
+    entries = []
+    for index in indices:
+        entry = _worker_introspector.inspect_api(_worker_introspector.apis[index])
+        entry['serializers'] = [get_class_path(s) for s in entry['serializers']]
+        entries.append((index, entry))
+    return entries, dict(stats.counters)
+
+
 class ApiIntrospector(object):
     """
     Inspect apis found by url parser
     """
 
-    def __init__(self, apis):
+    def __init__(self, apis, manifest=None, jobs=1):
+        """
+        :param list apis: apis found by url parser
+        :param Manifest manifest: manifest to reuse operations of unchanged endpoints
+        :param int jobs: number of worker processes to introspect apis
+        """
         self.apis = apis
+        self.manifest = manifest
+        self.jobs = jobs or 1
         self.serializers = []
         self.security_definitions = {}
 
@@ -48,22 +118,109 @@ class ApiIntrospector(object):
         :return: paths
         :rtype: dict
         """
+        entries = {}
+        introspected = []
+        for index, api in enumerate(self.apis):
+            stats.incr('endpoints')
+
+            entry = self.manifest.get(api) if self.manifest is not None else None
+            if entry is None:
+                introspected.append(index)
+            else:
+                entries[index] = entry
+                stats.incr('endpoints reused')
+
+        entries.update(self.inspect_apis(introspected))
+        if self.manifest is not None:
+            for index in introspected:
+                self.manifest.set(self.apis[index], **entries[index])
+
         paths = dict()
-        for api in self.apis:
-            view_introspector = get_view_introspector(api)
-            for method_introspector in view_introspector:
-                if method_introspector.http_method.lower() == 'options':
-                    continue
+        # merge in url order, so result doesn't depend on number of jobs
+        for index, api in enumerate(self.apis):
+            entry = entries[index]
+            self.serializers.extend(entry['serializers'])
+            self.security_definitions.update(entry['security_definitions'])
+
+            if entry['operations']:
+                paths.setdefault(api['path'], {}).update(entry['operations'])
+        return paths
+
+    def inspect_apis(self, indices):
+        """
+        Introspect apis in worker processes if more than one job was requested
+
+        :param list indices: indices of apis
+        :return: entries by api index
+        :rtype: dict
+        """
+        jobs = min(self.jobs, len(indices))
+        if jobs <= 1:
+            return dict((index, self.inspect_api(self.apis[index])) for index in indices)
+
+        if not hasattr(os, 'fork'):
+            logger.warning('Parallel introspection requires fork, apis are introspected in single process')
+            return dict((index, self.inspect_api(self.apis[index])) for index in indices)
+
+        # contiguous shards keep views of the same module in the same worker
+        size = max(1, len(indices) // (jobs * 4))
+        shards = [indices[i:i + size] for i in range(0, len(indices), size)]
+
+        global _worker_introspector
+        _worker_introspector = self
+        context = multiprocessing.get_context('fork') if hasattr(multiprocessing, 'get_context') else multiprocessing
+        pool = context.Pool(jobs)
+        try:
+            results = pool.map(_inspect_shard, shards)
+            pool.close()
+        finally:
+            pool.terminate()
+            pool.join()
+            _worker_introspector = None
+
+        stats.set('introspection jobs', jobs)
+        entries = {}
+        for shard_entries, counters in results:
+            for counter, value in counters.items():
+                stats.incr(counter, value)
+
+            for index, entry in shard_entries:
+                try:
+                    entry['serializers'] = [load_class(path) for path in entry['serializers']]
+                except (ImportError, AttributeError):
+                    # serializer class is not importable, e.g. created in function
+                    entry = self.inspect_api(self.apis[index])
+                entries[index] = entry
+        return entries
+
+    def inspect_api(self, api):
+        """
+        Introspect single api
+
+        :param dict api: api found by url parser
+        :return: operations by http method, serializers and security definitions of api
+        :rtype: dict
+        """
+        operations = OrderedDict()
+        serializers = []
+        security_definitions = OrderedDict()
 
-                self.serializers.extend(method_introspector.get_serializers())
-                self.security_definitions.update(method_introspector.get_security_definitions())
+        view_introspector = get_view_introspector(api)
+        for method_introspector in view_introspector:
+            if method_introspector.http_method.lower() == 'options':
+                continue
+            stats.incr('operations')
 
-                if method_introspector.introspector.path not in paths:
-                    paths[method_introspector.introspector.path] = {}
+            serializers.extend(method_introspector.get_serializers())
+            security_definitions.update(method_introspector.get_security_definitions())
 
-                paths[method_introspector.introspector.path][method_introspector.http_method.lower()] = \
-                    json.loads(json.dumps(method_introspector.get_operation(), cls=LazyEncoder))
-        return paths
+            operations[method_introspector.http_method.lower()] = normalize(method_introspector.get_operation())
+
+        return {
+            'operations': operations,
+            'serializers': serializers,
+            'security_definitions': normalize(security_definitions),
+        }
 
     def get_definitions(self):
         """
@@ -74,8 +231,7 @@ class ApiIntrospector(object):
         """
         definitions = OrderedDict()
         for serializer in set(self.serializers):
-            si = SerializerIntrospector(serializer)
+            si = SerializerIntrospector.shared(serializer)
             definitions[si.name] = si.build_response_object(inline=True)['schema']
 
-        # tricky dumps and loads for django specific fields
-        return json.loads(json.dumps(definitions, cls=LazyEncoder))
+        return normalize(definitions)
@@ -1,7 +1,8 @@
+import inspect
 from abc import ABCMeta
 
-from py2swagger.introspector import BaseDocstringIntrospector
-from py2swagger.utils import OrderedDict
+from py2swagger.introspector import BaseDocstringIntrospector, registry
+from py2swagger.utils import OrderedDict, memoized_property
 
 
 class BaseAuthenticationIntrospector(BaseDocstringIntrospector):
@@ -11,6 +12,7 @@ class BaseAuthenticationIntrospector(BaseDocstringIntrospector):
 
     __metaclass__ = ABCMeta
     name = None
+    shared_parsers = True
 
 
 class BasicAuthenticationIntrospector(BaseAuthenticationIntrospector):
@@ -19,15 +21,15 @@ class BasicAuthenticationIntrospector(BaseAuthenticationIntrospector):
     """
     name = 'basic_authentication'
 
-    @property
+    @memoized_property
     def security(self):
-        security = super(BasicAuthenticationIntrospector, self).security
+        security = list(super(BasicAuthenticationIntrospector, self).security)
         security.extend([
             OrderedDict([(self.name, [])]),
         ])
         return security
 
-    @property
+    @memoized_property
     def security_definitions(self):
         """
         Collects authentication security definitions
@@ -35,7 +37,7 @@ class BasicAuthenticationIntrospector(BaseAuthenticationIntrospector):
         :return: authentication security definitions
         :rtype: dict
         """
-        security_definitions = super(BasicAuthenticationIntrospector, self).security_definitions
+        security_definitions = OrderedDict(super(BasicAuthenticationIntrospector, self).security_definitions)
         security_definitions.update(OrderedDict({
             self.name: {
                 'type': 'basic',
@@ -54,15 +56,15 @@ class TokenAuthenticationIntrospector(BaseAuthenticationIntrospector):
     """
     name = 'djangorestframework_token_authentication'
 
-    @property
+    @memoized_property
     def security(self):
-        security = super(TokenAuthenticationIntrospector, self).security
+        security = list(super(TokenAuthenticationIntrospector, self).security)
         security.extend([
             OrderedDict({self.name: []})
         ])
         return security
 
-    @property
+    @memoized_property
     def security_definitions(self):
         """
         Collects authentication security definitions
@@ -70,7 +72,7 @@ class TokenAuthenticationIntrospector(BaseAuthenticationIntrospector):
         :return: authentication security definitions
         :rtype: dict
         """
-        security_definitions = super(TokenAuthenticationIntrospector, self).security_definitions
+        security_definitions = OrderedDict(super(TokenAuthenticationIntrospector, self).security_definitions)
         security_definitions.update(OrderedDict({
             self.name: {
                 'type': 'apiKey',
@@ -101,7 +103,11 @@ def get_authentication_introspectors(view):
     introspectors = []
 
     for authenticator in authenticators:
-        introspectors.append(
-            authenticators_map.get(authenticator, BaseAuthenticationIntrospector)(authenticator)
-        )
+        introspector_class = authenticators_map.get(authenticator, BaseAuthenticationIntrospector)
+        if inspect.isclass(authenticator):
+            # authentication introspectors do not depend on view, so they are shared
+            introspector = registry.get((introspector_class, authenticator), introspector_class, authenticator)
+        else:
+            introspector = introspector_class(authenticator)
+        introspectors.append(introspector)
     return introspectors
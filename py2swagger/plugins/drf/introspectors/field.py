@@ -4,7 +4,7 @@ from rest_framework import fields
 from rest_framework.relations import RelatedField
 from rest_framework.serializers import BaseSerializer
 
-from py2swagger.utils import OrderedDict
+from py2swagger.utils import OrderedDict, materialize
 from py2swagger.yamlparser import YAMLDocstringParser
 
 
@@ -52,8 +52,8 @@ class FieldIntrospector(object):
         for cls in inspect.getmro(self._field.__class__):
             parser.update(inspect.getdoc(cls))
 
-        return parser.schema.get('request'), \
-               parser.schema.get('response')
+        return materialize(parser.schema.get('request')), \
+               materialize(parser.schema.get('response'))
 
     def _get_field_object(self, request=False):
         """
@@ -67,10 +67,10 @@ class FieldIntrospector(object):
             if getattr(self._field, 'many', None):
                 result = {
                     'type': 'array',
-                    'items': self._serializer_inrospector_class(self._field).build_response_object(),
+                    'items': self._serializer_inrospector_class.shared(self._field).build_response_object(),
                 }
             else:
-                result = self._serializer_inrospector_class(self._field).build_response_object()
+                result = self._serializer_inrospector_class.shared(self._field).build_response_object()
         else:
             field_type, data_type, data_format = self._get_field_type(self._field)
             if data_type == 'file' and not request:
@@ -1,7 +1,7 @@
 import inspect
 
 from py2swagger.introspector import BaseDocstringIntrospector
-from py2swagger.utils import OrderedDict
+from py2swagger.utils import OrderedDict, memoized_property
 
 
 class BaseFilterBackendIntrospector(BaseDocstringIntrospector):
@@ -9,6 +9,8 @@ class BaseFilterBackendIntrospector(BaseDocstringIntrospector):
     Found filter specific parameters and responses
     """
 
+    shared_parsers = True
+
     def __init__(self, view, filter_backend):
         """
         :param view: DjangoRestFramework view instance
@@ -20,9 +22,9 @@ class BaseFilterBackendIntrospector(BaseDocstringIntrospector):
 
 class DjangoFilterBackendIntrospector(BaseFilterBackendIntrospector):
 
-    @property
+    @memoized_property
     def parameters(self):
-        parameters = super(DjangoFilterBackendIntrospector, self).parameters
+        parameters = list(super(DjangoFilterBackendIntrospector, self).parameters)
 
         filter_fields = getattr(self.view, 'filter_fields', [])
         for field_name in filter_fields:
@@ -45,9 +47,9 @@ class DjangoFilterBackendIntrospector(BaseFilterBackendIntrospector):
 
 class OrderingFilterBackendIntrospector(BaseFilterBackendIntrospector):
 
-    @property
+    @memoized_property
     def parameters(self):
-        parameters = super(OrderingFilterBackendIntrospector, self).parameters
+        parameters = list(super(OrderingFilterBackendIntrospector, self).parameters)
         ordering_fields = getattr(self.view, 'ordering_fields', [])
         ordering_param = getattr(self._instance, 'ordering_param', 'ordering')
 
@@ -3,8 +3,9 @@ import re
 
 from django.contrib.auth.models import AnonymousUser
 from django.http import HttpRequest
-from py2swagger.introspector import BaseDocstringIntrospector
-from py2swagger.utils import get_decorators, OrderedDict, load_class, clean_parameters, flatten
+from py2swagger.introspector import BaseDocstringIntrospector, registry
+from py2swagger.stats import stats
+from py2swagger.utils import get_decorators, OrderedDict, load_class, clean_parameters, flatten, memoized_property
 from rest_framework.views import get_view_name
 from rest_framework import status
 
@@ -32,17 +33,33 @@ class BaseMethodIntrospector(BaseDocstringIntrospector):
         self.introspector = view_introspector
         self.callback = view_introspector.callback
         self.method_callback = self._method_callback()
-        self.view = self._create_view()
+        self.view = self._get_view()
 
         super(BaseMethodIntrospector, self).__init__(self.method_callback)
 
         self.auth_introspectors = get_authentication_introspectors(self.view)
 
+    def _get_view(self):
+        """
+        Returns prepared view shared by introspectors of the same view, http method and action
+        :return: view
+        """
+        default_args = getattr(self.introspector.pattern, 'default_args', None) or {}
+        key = ('view', self.__class__, self.callback, self.http_method, self.method)
+        try:
+            key += (frozenset(default_args.items()),)
+            hash(key)
+        except TypeError:
+            # unhashable default arguments
+            return self._create_view()
+        return registry.get(key, self._create_view)
+
     def _create_view(self):
         """
         Creates DjangoRestFramework view
         :return: view
         """
+        stats.incr('views created')
         view = self.callback()
 
         view.kwargs = getattr(view, 'kwargs', dict())
@@ -70,7 +87,7 @@ class BaseMethodIntrospector(BaseDocstringIntrospector):
         :return: swagger tags
         :rtype: list
         """
-        tags = self.parser.get_tags() or self.introspector.parser.get_tags()
+        tags = list(self.parser.get_tags() or self.introspector.parser.get_tags())
         if not tags:
             tags = [get_view_name(self.introspector.callback).lower()]
 
@@ -122,7 +139,7 @@ class BaseMethodIntrospector(BaseDocstringIntrospector):
         """
         return self.parser.get_description()
 
-    @property
+    @memoized_property
     def parameters(self):
         """
         Collects parameters from introspectors
@@ -130,14 +147,14 @@ class BaseMethodIntrospector(BaseDocstringIntrospector):
         :return: list of parameters
         :rtype: list
         """
-        parameters = super(BaseMethodIntrospector, self).parameters
+        parameters = list(super(BaseMethodIntrospector, self).parameters)
         parameters.extend(self.introspector.parameters)
 
         # add serializer parameters only in several http methods
         if self.http_method.lower() in ('post', 'put', 'patch'):
             serializer = self._get_serializer(request=True)
             if serializer:
-                si = SerializerIntrospector(serializer)
+                si = SerializerIntrospector.shared(serializer)
                 parameters.extend(si.get_parameters())
 
         # add filter and pagination parameters only in 'list' methods
@@ -183,7 +200,7 @@ class BaseMethodIntrospector(BaseDocstringIntrospector):
         """
         return clean_parameters(self.parameters, self.method)
 
-    @property
+    @memoized_property
     def responses(self):
         """
         Collects method responses
@@ -198,7 +215,7 @@ class BaseMethodIntrospector(BaseDocstringIntrospector):
         serializer = self._get_serializer()
 
         if serializer and not responses.get(200, None):
-            si = SerializerIntrospector(serializer)
+            si = SerializerIntrospector.shared(serializer)
             if 'list' in self.method.lower():
                 pagination_introspector = get_pagination_introspector(self.view, si=si)
                 responses.update(pagination_introspector.responses)
@@ -214,6 +231,8 @@ class BaseMethodIntrospector(BaseDocstringIntrospector):
         # TODO this code wants to be rewritten
         if response:
             if status_code == status.HTTP_204_NO_CONTENT:
+                # response may be shared with docstring or pagination introspectors
+                response = OrderedDict(response)
                 response.pop('schema', None)
             if not responses.get(status_code, None):
                 responses[status_code] = response
@@ -240,18 +259,20 @@ class BaseMethodIntrospector(BaseDocstringIntrospector):
                 return load_class(serializer_path)
         return self._get_view_serializer()
 
+    @memoized_property
+    def _view_serializer(self):
+        serializer = None
+        if hasattr(self.callback, 'get_serializer_class') and self.view is not None:
+            serializer = self.view.get_serializer_class()
+        return serializer
+
     def _get_view_serializer(self):
         """
         Get method serializer
 
         :return: DjangoRestFramework Serializer Class
         """
-        serializer = None
-        if hasattr(self.callback, 'get_serializer_class'):
-            view = self._create_view()
-            if view is not None:
-                serializer = view.get_serializer_class()
-        return serializer
+        return self._view_serializer
 
     def get_serializers(self):
         """
@@ -274,13 +295,13 @@ class BaseMethodIntrospector(BaseDocstringIntrospector):
         return serializers
 
     def get_security_definitions(self):
-        security_definitions = super(BaseMethodIntrospector, self).security_definitions
+        security_definitions = OrderedDict(super(BaseMethodIntrospector, self).security_definitions)
         for introspector in flatten(self.auth_introspectors):
             security_definitions.update(introspector.security_definitions)
         return security_definitions
 
     def _get_security(self):
-        security = super(BaseMethodIntrospector, self).security
+        security = list(super(BaseMethodIntrospector, self).security)
         for introspector in flatten(self.auth_introspectors):
             security.extend(introspector.security)
         return security
@@ -1,12 +1,13 @@
 from abc import ABCMeta
 from py2swagger.introspector import BaseDocstringIntrospector
-from py2swagger.utils import OrderedDict
+from py2swagger.utils import OrderedDict, memoized_property
 
 
 class BasePaginationIntrospector(BaseDocstringIntrospector):
     __metaclass__ = ABCMeta
     results_field = None
     response_fields = None
+    shared_parsers = True
 
     def __init__(self, view=None, instance=None, si=None):
         """
@@ -18,14 +19,14 @@ class BasePaginationIntrospector(BaseDocstringIntrospector):
         self.si = si
         super(BasePaginationIntrospector, self).__init__(instance)
 
-    @property
+    @memoized_property
     def responses(self):
         """
         Create pagination responses
         :return: Reponses object
         :rtype: OrderedDict
         """
-        responses = super(BasePaginationIntrospector, self).responses
+        responses = OrderedDict(super(BasePaginationIntrospector, self).responses)
         if self.si:
             if self.response_fields:
                 response = OrderedDict([
@@ -68,14 +69,14 @@ class PageNumberPaginationIntrospector(BasePaginationIntrospector):
         (results_field, None),
     )
 
-    @property
+    @memoized_property
     def parameters(self):
         """
         Collects pagination parameters from pagination class
         :return: Parameters array
         :rtype: list
         """
-        parameters = super(PageNumberPaginationIntrospector, self).parameters
+        parameters = list(super(PageNumberPaginationIntrospector, self).parameters)
 
         page_query_param = getattr(self._instance, 'page_query_param', None)
         if page_query_param:
@@ -102,14 +103,14 @@ class LimitOffsetPaginationIntrospector(BasePaginationIntrospector):
         (results_field, None),
     )
 
-    @property
+    @memoized_property
     def parameters(self):
         """
         Collects pagination parameters from pagination class
         :return: Parameters array
         :rtype: list
         """
-        parameters = super(LimitOffsetPaginationIntrospector, self).parameters
+        parameters = list(super(LimitOffsetPaginationIntrospector, self).parameters)
 
         limit_query_param = getattr(self._instance, 'limit_query_param', None)
         offset_query_param = getattr(self._instance, 'offset_query_param', None)
@@ -146,14 +147,14 @@ class CursorPaginationIntrospector(BasePaginationIntrospector):
         (results_field, None),
     )
 
-    @property
+    @memoized_property
     def parameters(self):
         """
         Collects pagination parameters from pagination class
         :return: Parameters array
         :rtype: list
         """
-        parameters = super(CursorPaginationIntrospector, self).parameters
+        parameters = list(super(CursorPaginationIntrospector, self).parameters)
 
         cursor_query_param = getattr(self._instance, 'cursor_query_param', None)
 
@@ -1,6 +1,8 @@
 import inspect
 from copy import deepcopy
 
+from py2swagger.introspector import registry
+from py2swagger.stats import stats
 from py2swagger.utils import OrderedDict
 from py2swagger.yamlparser import YAMLDocstringParser
 from rest_framework.serializers import ModelSerializer, ListSerializer
@@ -22,8 +24,25 @@ class SerializerIntrospector(object):
 
         self.serializer = serializer
         self.name = self._get_name()
+        self._schemas = {}
 
-        self.fields = self._collect_fields()
+        with stats.timer('serializer introspection'):
+            self.fields = self._collect_fields()
+        stats.incr('serializers introspected')
+
+    @classmethod
+    def shared(cls, serializer):
+        """
+        Returns introspector shared by all usages of serializer class,
+        so serializer fields are collected once
+
+        :param serializer: DjangoRestFramework Serializer class or instance
+        :rtype: SerializerIntrospector
+        """
+        if isinstance(serializer, ListSerializer):
+            serializer = serializer.child
+        serializer_class = serializer if inspect.isclass(serializer) else serializer.__class__
+        return registry.get((cls, serializer_class), cls, serializer)
 
     def _get_name(self):
         """
@@ -47,9 +66,12 @@ class SerializerIntrospector(object):
         docstring_fields = self._get_docstring_fields()
         _fields = OrderedDict()
 
-        fields_set = set(serializer_fields.keys()).union(docstring_fields.keys())
+        # serializer fields order, then fields described in docstring only,
+        # so schema doesn't depend on hash seed
+        field_names = list(serializer_fields.keys())
+        field_names.extend(name for name in docstring_fields.keys() if name not in serializer_fields)
 
-        for field_name in fields_set:
+        for field_name in field_names:
             if field_name in docstring_fields:
                 field_object = docstring_fields[field_name]
                 _fields[field_name] = self._prepare_docstring_field_object(field_object)
@@ -152,6 +174,16 @@ class SerializerIntrospector(object):
             return self._get_body_parameters()
 
     def _get_schema(self, multiple=False, inline=False, request=False):
+        """
+        :return: copy of schema, so callers are free to modify it
+        :rtype: OrderedDict
+        """
+        key = (multiple, inline, request)
+        if key not in self._schemas:
+            self._schemas[key] = self._create_schema(multiple, inline, request)
+        return deepcopy(self._schemas[key])
+
+    def _create_schema(self, multiple=False, inline=False, request=False):
         required = []
         properties = OrderedDict()
         schema = OrderedDict()
@@ -1,14 +1,57 @@
+import inspect
 from abc import ABCMeta, abstractmethod
+from django.views.generic import View
+from rest_framework import generics, mixins, views, viewsets
 from rest_framework.views import APIView
 from rest_framework.viewsets import ViewSetMixin
 from .method import BaseMethodIntrospector, ViewSetMethodIntrospector, ApiViewMethodIntrospector, \
     WrappedApiViewMethodIntrospector
 
 from ..exceptions import IntrospectorException
-from py2swagger.introspector import BaseDocstringIntrospector
+from py2swagger.introspector import BaseDocstringIntrospector, register_framework_classes
+from py2swagger.stats import stats
 from py2swagger.utils import get_decorators
 
 
+def _get_module_classes(*modules):
+    """
+    Returns classes defined in modules
+
+    :param modules: modules
+    :rtype: list
+    """
+    classes = []
+    for module in modules:
+        for value in vars(module).values():
+            if inspect.isclass(value) and value.__module__ == module.__name__:
+                classes.append(value)
+    return classes
+
+
+# DjangoRestFramework base views never contain yaml docstrings
+register_framework_classes(View, *_get_module_classes(generics, mixins, views, viewsets))
+
+
+def get_allowed_methods(callback):
+    """
+    Returns allowed http methods of view.
+    View is instantiated only if it overrides the way allowed methods are found
+
+    :param callback: DjangoRestFramework view class
+    :rtype: list
+    """
+    mro = inspect.getmro(callback)
+    owners = [
+        next((cls for cls in mro if name in vars(cls)), None)
+        for name in ('allowed_methods', '_allowed_methods')
+    ]
+    if owners[0] is APIView and owners[1] in (View, None):
+        return [m.upper() for m in callback.http_method_names if hasattr(callback, m)]
+
+    stats.incr('views created')
+    return callback().allowed_methods
+
+
 class BaseViewIntrospector(BaseDocstringIntrospector):
     """
     Base DjangoRestFramework view introspector
@@ -67,7 +110,7 @@ class ApiViewIntrospector(BaseViewIntrospector):
         """
         :return: Iterable object
         """
-        methods = self.callback().allowed_methods
+        methods = get_allowed_methods(self.callback)
         return map(lambda x: self.method_introspector(self, x), methods)
 
 
@@ -0,0 +1,286 @@
+import hashlib
+import inspect
+import json
+import logging
+import os
+import sys
+import tempfile
+from copy import deepcopy
+
+from py2swagger import __version__
+from py2swagger.utils import OrderedDict, get_decorators, get_mro_list, load_class
+
+logger = logging.getLogger(__name__)
+
+# view attributes which classes affect generated operations
+VIEW_CLASS_ATTRIBUTES = (
+    'serializer_class',
+    'filter_backends',
+    'pagination_class',
+    'authentication_classes',
+    'permission_classes',
+    'parser_classes',
+    'renderer_classes',
+)
+
+
+def get_class_path(cls):
+    """
+    :param cls: class
+    :return: importable class path
+    :rtype: str
+    """
+    return '{}.{}'.format(cls.__module__, cls.__name__)
+
+
+def _get_related_model(field):
+    """
+    :param field: serializer field
+    :return: model of related field queryset
+    """
+    queryset = getattr(field, 'queryset', None)
+    return getattr(queryset, 'model', None)
+
+
+def _get_serializer_dependencies(serializers):
+    """
+    :param serializers: serializer classes
+    :return: classes of serializers, their nested serializers, models, related models
+        and field classes with base classes
+    :rtype: list
+    """
+    classes = []
+    seen = set()
+    stack = list(serializers)
+
+    while stack:
+        cls = stack.pop()
+        if cls is None or cls in seen:
+            continue
+        seen.add(cls)
+        classes.extend(get_mro_list(cls, only_parents=False))
+
+        # model fields define fields of model serializers
+        stack.append(getattr(getattr(cls, 'Meta', None), 'model', None))
+
+        model_meta = getattr(cls, '_meta', None)
+        if hasattr(model_meta, 'get_fields'):
+            for model_field in model_meta.get_fields():
+                related_model = getattr(model_field, 'related_model', None)
+                if inspect.isclass(related_model):
+                    # related models are not followed further, their fields are used by nested serializers only
+                    classes.extend(get_mro_list(related_model, only_parents=False))
+
+        for field in getattr(cls, '_declared_fields', {}).values():
+            for attribute in ('child', 'child_relation'):
+                if getattr(field, attribute, None) is not None:
+                    field = getattr(field, attribute)
+            stack.append(field.__class__)
+            stack.append(_get_related_model(field))
+
+    return classes
+
+
+class Manifest(object):
+    """
+    Stores operations of every endpoint with fingerprint of everything they were introspected from:
+    sources of modules which define view, its base classes, decorators,
+    serializer, filter, pagination and authentication classes.
+    Endpoints with unchanged fingerprint are not introspected again.
+    """
+
+    manifest_version = 1
+
+    def __init__(self, path=None):
+        """
+        :param str path: manifest file path. Manifest without path is kept in memory only
+        """
+        self.path = path
+        self._entries = {}
+        self._used_keys = set()
+        self._module_hashes = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def load(self):
+        """
+        Load manifest entries from file
+
+        :return: number of loaded entries
+        :rtype: int
+        """
+        if not self.path or not os.path.exists(self.path):
+            return 0
+
+        try:
+            with open(self.path) as f:
+                data = json.load(f, object_pairs_hook=OrderedDict)
+        except (IOError, ValueError) as e:
+            logger.warning('Could not load manifest %s: %s', self.path, e)
+            return 0
+
+        if data.get('version') != self.manifest_version or data.get('py2swagger') != __version__:
+            return 0
+
+        self._entries = data.get('endpoints', {})
+        return len(self._entries)
+
+    def save(self):
+        """
+        Save entries of endpoints found in current run
+
+        :return: number of saved entries
+        :rtype: int
+        """
+        endpoints = OrderedDict((k, v) for k, v in self._entries.items() if k in self._used_keys)
+        if not self.path:
+            return len(endpoints)
+
+        data = OrderedDict([
+            ('version', self.manifest_version),
+            ('py2swagger', __version__),
+            ('endpoints', endpoints),
+        ])
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            os.rename(tmp_path, self.path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        return len(endpoints)
+
+    def reset(self):
+        """
+        Prepare manifest for next run in the same process: forget modules source hashes
+        and endpoints found in previous run
+        """
+        self._used_keys.clear()
+        self._module_hashes.clear()
+
+    @staticmethod
+    def get_key(api):
+        """
+        :param dict api: api found by url parser
+        :return: endpoint key
+        :rtype: str
+        """
+        return '{} {}'.format(api['path'], get_class_path(api['callback']))
+
+    def get(self, api):
+        """
+        :param dict api: api found by url parser
+        :return: entry with operations, serializers and security definitions
+            or None if endpoint changed
+        :rtype: dict
+        """
+        key = self.get_key(api)
+        self._used_keys.add(key)
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        try:
+            serializers = [load_class(path) for path in entry['serializers']]
+        except ImportError:
+            return None
+
+        if entry['fingerprint'] != self.get_fingerprint(api, serializers):
+            return None
+
+        # schema builder modifies operations, so entries are copied on read and on write
+        return {
+            'operations': deepcopy(entry['operations']),
+            'serializers': serializers,
+            'security_definitions': deepcopy(entry['security_definitions']),
+        }
+
+    def set(self, api, operations, serializers, security_definitions):
+        """
+        :param dict api: api found by url parser
+        :param dict operations: normalized operations by http method
+        :param list serializers: serializer classes used by operations
+        :param dict security_definitions: security definitions used by operations
+        """
+        key = self.get_key(api)
+        self._used_keys.add(key)
+        self._entries[key] = OrderedDict([
+            ('fingerprint', self.get_fingerprint(api, serializers)),
+            ('operations', deepcopy(operations)),
+            ('serializers', sorted(set(get_class_path(s) for s in serializers))),
+            ('security_definitions', deepcopy(security_definitions)),
+        ])
+
+    def get_fingerprint(self, api, serializers=()):
+        """
+        :param dict api: api found by url parser
+        :param serializers: serializer classes used by operations
+        :return: hash of endpoint sources
+        :rtype: str
+        """
+        callback = api['callback']
+
+        parts = [__version__, api['path'], get_class_path(callback)]
+        actions = getattr(api['pattern'].callback, 'actions', None)
+        if actions:
+            parts.append(repr(sorted(actions.items())))
+
+        for module_name in sorted(self._get_modules(callback, serializers)):
+            parts.append(module_name)
+            parts.append(self._get_module_hash(module_name))
+
+        return hashlib.sha1('\n'.join(parts).encode('utf-8')).hexdigest()
+
+    def _get_modules(self, callback, serializers=()):
+        classes = list(get_mro_list(callback, only_parents=False))
+        serializers = list(serializers)
+
+        for name in VIEW_CLASS_ATTRIBUTES:
+            value = getattr(callback, name, None)
+            if value is None:
+                continue
+            for cls in (value if isinstance(value, (list, tuple)) else [value]):
+                if inspect.isclass(cls):
+                    classes.extend(get_mro_list(cls, only_parents=False))
+                    if name == 'serializer_class':
+                        serializers.append(cls)
+
+        classes.extend(_get_serializer_dependencies(serializers))
+
+        modules = set()
+        for cls in classes:
+            modules.add(cls.__module__)
+            for value in vars(cls).values():
+                if isinstance(value, (staticmethod, classmethod)):
+                    value = value.__func__
+                if inspect.isfunction(value):
+                    modules.update(f.__module__ for f in get_decorators(value))
+
+        modules.discard(None)
+        return modules
+
+    def _get_module_hash(self, module_name):
+        if module_name not in self._module_hashes:
+            module_hash = ''
+            module = sys.modules.get(module_name)
+            try:
+                source_path = inspect.getsourcefile(module) if module is not None else None
+            except TypeError:
+                # builtin module
+                source_path = None
+
+            if source_path and os.path.exists(source_path):
+                with open(source_path, 'rb') as f:
+                    module_hash = hashlib.sha1(f.read()).hexdigest()
+
+            self._module_hashes[module_name] = module_hash
+        return self._module_hashes[module_name]
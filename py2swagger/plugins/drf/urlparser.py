@@ -1,18 +1,170 @@
+import fnmatch
+import re
+
 from django.conf import settings
-from django.contrib.admindocs.views import simplify_regex
+from django.contrib.admindocs.views import simplify_regex as _simplify_regex
 from django.utils import six
 from importlib import import_module
 
 from rest_framework.views import APIView
 
+from py2swagger.stats import stats
+
+REGEX_PREFIX = 're:'
+
+# characters which end literal part of simplified path
+_PATH_SPECIAL_CHARS = '<>{}[]()*?+.|^$\\'
+
+_simplified_paths = {}
+
+
+def simplify_regex(pattern):
+    """
+    Memoized django.contrib.admindocs simplify_regex, url regexes are shared by
+    every endpoint of included urlconf
+
+    :param str pattern: url regex
+    :return: path
+    :rtype: str
+    """
+    path = _simplified_paths.get(pattern)
+    if path is None:
+        path = _simplified_paths[pattern] = _simplify_regex(pattern)
+    return path
+
+
+def get_literal_prefix(path):
+    """
+    :param str path: simplified path
+    :return: part of path before first variable or regex special character
+    :rtype: str
+    """
+    for i, char in enumerate(path):
+        if char in _PATH_SPECIAL_CHARS:
+            return path[:i]
+    return path
+
+
+class PathPattern(object):
+    """
+    Path pattern: glob, e.g. /api/v1/*, or regex with "re:" prefix, e.g. re:^/api/v[12]/
+    Glob matches whole path, regex matches any part of path
+    """
+
+    def __init__(self, pattern):
+        """
+        :param str pattern: glob or regex with "re:" prefix
+        """
+        self.pattern = pattern
+
+        if pattern.startswith(REGEX_PREFIX):
+            regex = pattern[len(REGEX_PREFIX):]
+            self._match = re.compile(regex).search
+            self.prefix, self.matches_prefix = self._get_regex_prefix(regex)
+        else:
+            self._match = re.compile(fnmatch.translate(pattern)).match
+            self.prefix = pattern
+            for i, char in enumerate(pattern):
+                if char in '*?[':
+                    self.prefix = pattern[:i]
+                    break
+            self.matches_prefix = pattern == self.prefix + '*'
+
+    @staticmethod
+    def _get_regex_prefix(regex):
+        """
+        :param str regex: regex
+        :return: literal prefix of every matched path and whether every path with prefix is matched
+        :rtype: tuple
+        """
+        if not regex.startswith('^') or '|' in regex:
+            return '', False
+
+        body = regex[1:]
+        for i, char in enumerate(body):
+            if char in '.^$*+?{}[]\\|()':
+                # quantifier makes previous character optional
+                return body[:i - 1 if char in '*?{' and i else i], False
+        return body, True
+
+    def match(self, path):
+        """
+        :param str path: endpoint path
+        :rtype: bool
+        """
+        return self._match(path) is not None
+
+    def may_match(self, prefix):
+        """
+        :param str prefix: literal prefix of paths
+        :return: False if none of paths with prefix is matched
+        :rtype: bool
+        """
+        return self.prefix.startswith(prefix) or prefix.startswith(self.prefix)
+
+    def matches_all(self, prefix):
+        """
+        :param str prefix: literal prefix of paths
+        :return: True if every path with prefix is matched
+        :rtype: bool
+        """
+        return self.matches_prefix and prefix.startswith(self.prefix)
+
+
+class PathFilter(object):
+    """
+    Filters endpoint paths by include and exclude patterns, compiled once
+    """
+
+    def __init__(self, include=None, exclude=None, filter_path=None):
+        """
+        :param list include: path patterns, path must match any of them
+        :param list exclude: path patterns, path must not match any of them
+        :param str filter_path: legacy filter, path must contain it
+        """
+        self.include = [PathPattern(p) for p in include or ()]
+        self.exclude = [PathPattern(p) for p in exclude or ()]
+        self.filter_path = filter_path
+
+    def __bool__(self):
+        return bool(self.include or self.exclude or self.filter_path)
+
+    __nonzero__ = __bool__
+
+    def match(self, path):
+        """
+        :param str path: endpoint path
+        :rtype: bool
+        """
+        if self.filter_path and self.filter_path not in path.strip('/'):
+            return False
+        if self.include and not any(p.match(path) for p in self.include):
+            return False
+        return not any(p.match(path) for p in self.exclude)
+
+    def prune(self, prefix):
+        """
+        :param str prefix: simplified path prefix of included urls
+        :return: True if none of paths with prefix could be matched
+        :rtype: bool
+        """
+        prefix = get_literal_prefix(prefix)
+        if self.include and not any(p.may_match(prefix) for p in self.include):
+            return True
+        return any(p.matches_all(prefix) for p in self.exclude)
+
 
 class UrlParser(object):
 
-    def get_apis(self, url_patterns=None, urlconf=None, filter_path=None, exclude_namespaces=None):
+    def get_apis(self, url_patterns=None, urlconf=None, filter_path=None, exclude_namespaces=None,
+                 include=None, exclude=None):
         """
         Returns all the DRF APIViews found in the project URLs
         patterns -- supply list of patterns (optional)
+        filter_path -- part of path which is required (optional)
         exclude_namespaces -- list of namespaces to ignore (optional)
+        include -- list of glob or "re:" prefixed regex path patterns, path must match any of them (optional)
+        exclude -- list of glob or "re:" prefixed regex path patterns to ignore (optional)
         """
 
         if not url_patterns and urlconf:
@@ -29,39 +181,45 @@ class UrlParser(object):
             url_patterns,
             filter_path=filter_path,
             exclude_namespaces=exclude_namespaces,
+            include=include,
+            exclude=exclude,
         )
 
         return formatted_apis
 
-    def format_api_patterns(self, url_patterns, prefix='', filter_path=None, exclude_namespaces=None):
+    def format_api_patterns(self, url_patterns, prefix='', filter_path=None, exclude_namespaces=None,
+                            include=None, exclude=None):
         """
-        Uses recursion to format url tree.
+        Walks url tree in order of patterns. Included urls which paths can't be matched by filters are skipped,
+        endpoint paths are filtered once
         patterns -- urlpatterns list
         prefix -- (optional) Prefix for URL pattern
         """
+        path_filter = PathFilter(include, exclude, filter_path)
         url_patterns_list = []
+        stack = [(iter(url_patterns), prefix)]
 
-        for pattern in url_patterns:
+        while stack:
+            patterns, prefix = stack[-1]
+            pattern = next(patterns, None)
+            if pattern is None:
+                stack.pop()
+                continue
 
             if hasattr(pattern, 'url_patterns'):
                 if exclude_namespaces and pattern.namespace in exclude_namespaces:
                     continue
                 pref = prefix + pattern.regex.pattern
-                url_patterns_list.extend(self.format_api_patterns(
-                    pattern.url_patterns,
-                    pref,
-                    filter_path=filter_path,
-                    exclude_namespaces=exclude_namespaces,
-                ))
+                if path_filter and path_filter.prune(simplify_regex(pref)):
+                    stats.incr('url branches pruned')
+                    continue
+                stack.append((iter(pattern.url_patterns), pref))
             else:
-                endpoint_data = self.gather_endpoint_data(pattern, prefix, filter_path=filter_path)
+                endpoint_data = self.gather_endpoint_data(pattern, prefix)
 
-                if endpoint_data:
+                if endpoint_data and path_filter.match(endpoint_data['path']):
                     url_patterns_list.append(endpoint_data)
 
-        if filter_path:
-            url_patterns_list = [api for api in url_patterns_list if filter_path in api['path'].strip('/')]
-
         return url_patterns_list
 
     def gather_endpoint_data(self, pattern, prefix='', filter_path=None):
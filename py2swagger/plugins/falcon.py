@@ -2,6 +2,7 @@ from importlib import import_module
 
 from py2swagger.plugins import Py2SwaggerPlugin, Py2SwaggerPluginException
 from py2swagger.introspector import BaseDocstringIntrospector
+from py2swagger.stats import stats
 from py2swagger.utils import OrderedDict
 
 
@@ -15,14 +16,14 @@ class FalconMethodIntrospector(BaseDocstringIntrospector):
         """
 
         operation = OrderedDict(
-            tags=self.parser.get_tags(),
+            tags=list(self.parser.get_tags()),
             summary=self.parser.get_summary(),
             description=self.parser.get_description(),
-            parameters=self.parameters,
+            parameters=list(self.parameters),
             produces=None,
             consumes=None,
-            responses=self.responses,
-            security=self.security
+            responses=OrderedDict(self.responses),
+            security=list(self.security)
         )
 
         for key, value in list(operation.items()):
@@ -33,7 +34,7 @@ class FalconMethodIntrospector(BaseDocstringIntrospector):
         return operation
 
     def get_security_definitions(self):
-        return self.security_definitions
+        return OrderedDict(self.security_definitions)
 
 
 class FalconPy2SwaggerPlugin(Py2SwaggerPlugin):
@@ -48,7 +49,8 @@ class FalconPy2SwaggerPlugin(Py2SwaggerPlugin):
     def run(self, arguments, *args, **kwargs):
         module_name, application_name = arguments.app.split(':', 1)
         try:
-            m = import_module(module_name)
+            with stats.timer('framework setup'):
+                m = import_module(module_name)
         except ImportError:
             raise Py2SwaggerPluginException('No module named {}'.format(module_name))
 
@@ -56,18 +58,25 @@ class FalconPy2SwaggerPlugin(Py2SwaggerPlugin):
         if app is None or not hasattr(app, '_router'):
             raise Py2SwaggerPluginException('Invalid Falcon application {}'.format(application_name))
 
+        with stats.timer('url discovery'):
+            routes = list(self.generate_routes(app._router._roots))
+        self.preparse(arguments, [f for _, method_map in routes for f in method_map.values()])
+
         paths = {}
         security_definitions = {}
-        for path, method_map in self.generate_routes(app._router._roots):
-            if path not in paths:
-                paths[path] = {}
-            for method in method_map:
-                f = method_map[method]
-                if hasattr(f, '__self__') and f.__name__ not in self.filtered_methods:
-                    method_introspector = FalconMethodIntrospector(f)
-                    operation = method_introspector.get_operation()
-                    paths[path][method.lower()] = operation
-                    security_definitions.update(method_introspector.get_security_definitions())
+        with stats.timer('introspection'):
+            for path, method_map in routes:
+                stats.incr('endpoints')
+                if path not in paths:
+                    paths[path] = {}
+                for method in method_map:
+                    f = method_map[method]
+                    if hasattr(f, '__self__') and f.__name__ not in self.filtered_methods:
+                        method_introspector = FalconMethodIntrospector(f)
+                        operation = method_introspector.get_operation()
+                        paths[path][method.lower()] = operation
+                        security_definitions.update(method_introspector.get_security_definitions())
+                        stats.incr('operations')
 
         swagger_part = {
             'paths': paths,
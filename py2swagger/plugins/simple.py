@@ -2,6 +2,7 @@ import six
 
 from py2swagger.plugins import Py2SwaggerPlugin, Py2SwaggerPluginException
 from py2swagger.introspector import BaseDocstringIntrospector
+from py2swagger.stats import stats
 from py2swagger.utils import OrderedDict, load_class
 
 
@@ -19,12 +20,12 @@ class SimplePlugin(Py2SwaggerPlugin):
     @staticmethod
     def _operation(introspector):
         operation = OrderedDict(
-            tags=introspector.tags,
+            tags=list(introspector.tags),
             summary=introspector.parser.get_summary(),
             description=introspector.parser.get_description(),
-            parameters=introspector.parameters,
-            responses=introspector.responses,
-            security=introspector.security
+            parameters=list(introspector.parameters),
+            responses=OrderedDict(introspector.responses),
+            security=list(introspector.security)
         )
 
         # Remove empty keys
@@ -56,10 +57,21 @@ class SimplePlugin(Py2SwaggerPlugin):
             raise Py2SwaggerPluginException('Configuration is missed. Please add PLUGIN_SETTINGS[\'endpoints\'] to your '
                                             'configuration file.')
 
-        for path, method, callback in endpoints:
-            if isinstance(callback, six.string_types):
-                callback = load_class(callback)
-            self._introspect(path, method, callback)
+        self._paths = {}
+        self._security_definitions = {}
+
+        with stats.timer('framework setup'):
+            endpoints = [
+                (path, method, load_class(callback) if isinstance(callback, six.string_types) else callback)
+                for path, method, callback in endpoints
+            ]
+        self.preparse(arguments, [callback for _, _, callback in endpoints])
+
+        with stats.timer('introspection'):
+            for path, method, callback in endpoints:
+                self._introspect(path, method, callback)
+                stats.incr('endpoints')
+                stats.incr('operations')
 
         return {
             'paths': self._paths,
@@ -0,0 +1,100 @@
+import inspect
+import multiprocessing
+
+try:
+    from concurrent.futures import ProcessPoolExecutor
+except ImportError:  # pragma: no cover
+    # python 2 without "futures" backport
+    ProcessPoolExecutor = None
+
+from .cache import docstring_cache
+from .stats import stats
+from .utils import OrderedDict, get_mro_list, get_decorators
+from .yamlparser import YAMLDocstringParser
+
+
+def _get_documented_objects(callback):
+    """
+    Returns objects which docstrings are used by introspectors of callback:
+    class, its base classes and methods, function and its decorators
+
+    :param callback: class, function or method
+    :rtype: list
+    """
+    if inspect.ismethod(callback):
+        callback = callback.__func__
+
+    objects = []
+    if inspect.isclass(callback):
+        for cls in get_mro_list(callback, only_parents=False):
+            objects.append(cls)
+            for value in vars(cls).values():
+                if isinstance(value, (staticmethod, classmethod)):
+                    value = value.__func__
+                if inspect.isfunction(value):
+                    objects.extend(get_decorators(value))
+    elif inspect.isfunction(callback):
+        objects.extend(get_decorators(callback))
+
+    return objects
+
+
+def collect_docstrings(callbacks):
+    """
+    Collects unique docstrings with yaml section
+
+    :param callbacks: endpoint callbacks
+    :return: docstrings
+    :rtype: list
+    """
+    docstrings = OrderedDict()
+    seen = set()
+
+    for callback in callbacks:
+        for obj in _get_documented_objects(callback):
+            if id(obj) in seen:
+                continue
+            seen.add(id(obj))
+
+            doc = inspect.getdoc(obj)
+            if doc and '---' in doc:
+                docstrings[doc] = None
+
+    return list(docstrings)
+
+
+def _parse_docstring(docstring):
+    return YAMLDocstringParser()._parse_docstring_uncached(docstring)
+
+
+def preparse_docstrings(callbacks, workers=None):
+    """
+    Parses docstrings of callbacks in worker processes and seeds docstrings cache
+
+    :param callbacks: endpoint callbacks
+    :param int workers: number of worker processes. Default is number of CPUs
+    :return: number of parsed docstrings
+    :rtype: int
+    """
+    if docstring_cache.maxsize <= 0:
+        return 0
+
+    with stats.timer('docstring preparsing'):
+        docstrings = [d for d in collect_docstrings(callbacks) if d not in docstring_cache]
+        if not docstrings:
+            return 0
+
+        workers = workers or multiprocessing.cpu_count()
+        if ProcessPoolExecutor is None or workers == 1:
+            results = list(map(_parse_docstring, docstrings))
+        else:
+            chunksize = max(1, len(docstrings) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_parse_docstring, docstrings, chunksize=chunksize))
+
+        docstring_cache.update(
+            (docstring_cache.make_key(docstring), result) for docstring, result in zip(docstrings, results)
+        )
+
+    stats.incr('docstrings preparsed', len(docstrings))
+    return len(docstrings)
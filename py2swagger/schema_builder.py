@@ -1,7 +1,13 @@
+import hashlib
+import json
+import logging
+
 import six
 
 from .utils import OrderedDict
 
+logger = logging.getLogger(__name__)
+
 
 class SchemaBuilder(object):
 
@@ -10,6 +16,9 @@ class SchemaBuilder(object):
         self._schema_definitions = None
         self._schema = None
         self._kwargs = schema_properties
+        self._definition_hashes = None
+        self._interned_definitions = None
+        self.conflicts = None
 
     @property
     def schema(self):
@@ -20,6 +29,9 @@ class SchemaBuilder(object):
     def _generate_schema(self):
         self._schema_paths = OrderedDict()
         self._schema_definitions = OrderedDict()
+        self._definition_hashes = {}
+        self._interned_definitions = {}
+        self.conflicts = OrderedDict()
 
         self._schema = OrderedDict()
         self._schema['swagger'] = '2.0'
@@ -37,23 +49,50 @@ class SchemaBuilder(object):
         self._schema['definitions'] = self._schema_definitions
         self._schema['securityDefinitions'] = self._kwargs.get('securityDefinitions', {})
 
-        schema_definitions = _extract_definitions(_get_global_defs(self._kwargs.get('definitions', {})))
-        self._update_definitions(schema_definitions)
+        self._update_definitions(_iter_definitions(_get_global_defs(self._kwargs.get('definitions', {}))))
 
         for methods in self._schema['paths'].values():
             for operation in methods.values():
-                parameters_definitions = _extract_definitions(_get_list_defs(operation, 'parameters'))
-                responses_definitions = _extract_definitions(_get_dict_values_defs(operation, 'responses'))
-                self._update_definitions(parameters_definitions + responses_definitions)
+                self._update_definitions(_iter_definitions(_get_list_defs(operation, 'parameters')))
+                self._update_definitions(_iter_definitions(_get_dict_values_defs(operation, 'responses')))
 
     def _update_definitions(self, defs):
-        for definition in defs:
+        """
+        Adds definitions interned by their structural hash:
+        identical definitions are stored once and shared between ids,
+        definition which differs from already added one with the same id
+        is reported as conflict and skipped
+        """
+        # walk is finished before hashing, so nested definitions are already replaced by references
+        for definition in list(defs):
             def_id = definition.pop('id')
-            if def_id is not None:
-                if self._schema_definitions.get(def_id, None):
-                    self._schema_definitions[def_id].update(definition)
-                else:
-                    self._schema_definitions[def_id] = definition
+            if def_id is None:
+                continue
+
+            def_hash = _get_definition_hash(definition)
+            known_hash = self._definition_hashes.get(def_id)
+
+            if known_hash is None:
+                definition = self._interned_definitions.setdefault(def_hash, definition)
+                self._definition_hashes[def_id] = def_hash
+                self._schema_definitions[def_id] = definition
+            elif known_hash != def_hash:
+                logger.warning('Definition %s conflicts with previously added one and is skipped', def_id)
+                self.conflicts.setdefault(def_id, []).append(definition)
+
+
+def _get_definition_hash(definition):
+    """
+    :param dict definition: definition schema
+    :return: hash of definition structure, independent of dict keys order
+    :rtype: str
+    """
+    try:
+        canonical = json.dumps(definition, sort_keys=True, separators=(',', ':'), default=six.text_type)
+    except TypeError:
+        # keys of different types could not be sorted
+        canonical = json.dumps(definition, separators=(',', ':'), default=six.text_type)
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()
 
 
 def _extract_definitions(data, toplevel=True):
@@ -63,28 +102,42 @@ def _extract_definitions(data, toplevel=True):
     We require an 'id' field for the schema to be correctly
     added to the definitions list.
     """
+    return list(_iter_definitions(data, toplevel))
 
-    definitions = []
 
-    for item in data:
+def _iter_definitions(data, toplevel=True):
+    """
+    Walks through items and their nested properties and array items
+    using explicit stack, so nesting depth is not limited by recursion limit.
+    Replaces schemas with 'id' by references and yields them in depth-first order
+    """
+    stack = [(item, toplevel) for item in reversed(list(data))]
+
+    while stack:
+        item, item_toplevel = stack.pop()
+        if not isinstance(item, dict):
+            continue
+
+        children = []
         if 'schema' in item and item['schema']:
             schema = item['schema']
             schema_id = schema.get('id')
             if schema_id:
-                definitions.append(schema)
                 ref = {'$ref': '#/definitions/{}'.format(schema_id)}
 
-                if toplevel:
+                if item_toplevel:
                     item['schema'] = ref
                 else:
                     item.update(ref)
                     del item['schema']
 
-            definitions += _extract_definitions(_get_dict_values_defs(schema, 'properties'), False)
-            definitions += _extract_definitions(_get_array_defs(schema), False)
-        definitions += _extract_definitions(_get_array_defs(item), False)
+                yield schema
+
+            children.extend(_get_dict_values_defs(schema, 'properties'))
+            children.extend(_get_array_defs(schema))
+        children.extend(_get_array_defs(item))
 
-    return definitions
+        stack.extend((child, False) for child in reversed(children))
 
 
 def _get_list_defs(source, key):
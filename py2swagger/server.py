@@ -0,0 +1,250 @@
+import gzip
+import hashlib
+import json
+import logging
+import threading
+
+from six import BytesIO
+from six.moves.BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+from six.moves.socketserver import ThreadingMixIn
+
+from .introspector import registry
+from .stats import stats
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = '127.0.0.1'
+SCHEMA_PATHS = ('/', '/swagger.json')
+RELOAD_PATH = '/reload'
+
+
+def compress(content):
+    """
+    :param bytes content: data
+    :return: gzip-compressed data
+    :rtype: bytes
+    """
+    buffer = BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode='wb') as f:
+        f.write(content)
+    return buffer.getvalue()
+
+
+def reset_build_state():
+    """
+    Forgets state kept between schema builds: introspectors shared by classes,
+    which may be changed or reloaded since previous build, and stats
+    """
+    stats.reset()
+    registry.clear()
+
+
+class CachedSchema(object):
+    """
+    Keeps compact JSON representation of schema with its gzip-compressed copy and ETag.
+    Schema is built on first access and on rebuild only
+    """
+
+    def __init__(self, build):
+        """
+        :param build: callable without arguments which returns schema
+        """
+        self._build = build
+        self._lock = threading.Lock()
+        self._version = None
+
+    def _update(self):
+        schema = self._build()
+        content = json.dumps(schema, separators=(',', ':')).encode('utf-8')
+        etag = '"{}"'.format(hashlib.sha1(content).hexdigest())
+        self._version = (content, compress(content), etag)
+
+    def get(self):
+        """
+        :return: compact JSON, gzip-compressed JSON and ETag
+        :rtype: tuple
+        """
+        version = self._version
+        if version is None:
+            with self._lock:
+                if self._version is None:
+                    self._update()
+                version = self._version
+        return version
+
+    @property
+    def content(self):
+        return self.get()[0]
+
+    @property
+    def gzip_content(self):
+        return self.get()[1]
+
+    @property
+    def etag(self):
+        return self.get()[2]
+
+    def rebuild(self):
+        """
+        Builds schema again. Previous version is served until new one is ready
+        """
+        with self._lock:
+            reset_build_state()
+            self._update()
+
+    def invalidate(self):
+        """
+        Build schema again on next access
+        """
+        with self._lock:
+            reset_build_state()
+            self._version = None
+
+
+def accepts_gzip(accept_encoding):
+    """
+    :param str accept_encoding: Accept-Encoding header value
+    :rtype: bool
+    """
+    for coding in (accept_encoding or '').split(','):
+        parts = [p.strip() for p in coding.split(';')]
+        if parts[0].lower() not in ('gzip', '*'):
+            continue
+
+        for param in parts[1:]:
+            name, _, value = param.partition('=')
+            if name.strip() == 'q':
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
+def etag_matches(if_none_match, etag):
+    """
+    :param str if_none_match: If-None-Match header value
+    :param str etag: current ETag
+    :rtype: bool
+    """
+    if not if_none_match:
+        return False
+    tags = [t.strip() for t in if_none_match.split(',')]
+    # weak comparison, as compressed and plain representations share ETag
+    return '*' in tags or etag in tags or 'W/{}'.format(etag) in tags
+
+
+class SchemaRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serves schema of server's CachedSchema. POST to /reload rebuilds schema
+    """
+
+    def _send_schema(self, with_body=True):
+        content, gzip_content, etag = self.server.schema.get()
+
+        if etag_matches(self.headers.get('If-None-Match'), etag):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        if accepts_gzip(self.headers.get('Accept-Encoding')):
+            body = gzip_content
+            encoding = 'gzip'
+        else:
+            body = content
+            encoding = None
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.send_header('Vary', 'Accept-Encoding')
+        self.end_headers()
+        if with_body:
+            self.wfile.write(body)
+
+    def _send_error(self, code):
+        self.send_response(code)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def _get_path(self):
+        return self.path.split('?', 1)[0]
+
+    def do_GET(self):
+        if self._get_path() in SCHEMA_PATHS:
+            self._send_schema()
+        else:
+            self._send_error(404)
+
+    def do_HEAD(self):
+        if self._get_path() in SCHEMA_PATHS:
+            self._send_schema(with_body=False)
+        else:
+            self._send_error(404)
+
+    def do_POST(self):
+        if self._get_path() != RELOAD_PATH:
+            self._send_error(404)
+            return
+
+        try:
+            self.server.schema.rebuild()
+        except Exception:
+            logger.exception('Schema rebuild failed')
+            self._send_error(500)
+            return
+
+        self.send_response(204)
+        self.send_header('ETag', self.server.schema.etag)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        logger.info('%s - %s', self.address_string(), format % args)
+
+
+class SchemaServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+    def __init__(self, schema, address, handler_class=SchemaRequestHandler):
+        """
+        :param CachedSchema schema: served schema
+        :param tuple address: (host, port)
+        """
+        HTTPServer.__init__(self, address, handler_class)
+        self.schema = schema
+
+
+def parse_address(address):
+    """
+    :param str address: [HOST:]PORT
+    :return: (host, port)
+    :rtype: tuple
+    """
+    host, _, port = str(address).rpartition(':')
+    try:
+        port = int(port)
+    except ValueError:
+        raise ValueError('Invalid address: {}'.format(address))
+    return host or DEFAULT_HOST, port
+
+
+def serve(schema, address):
+    """
+    Builds schema and serves it until interrupted
+
+    :param CachedSchema schema: served schema
+    :param str address: [HOST:]PORT
+    """
+    schema.get()
+
+    server = SchemaServer(schema, parse_address(address))
+    logger.info('Serving schema on http://%s:%s/', *server.server_address[:2])
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
@@ -0,0 +1,150 @@
+import os
+import re
+
+import six
+
+from .utils import OrderedDict
+from .writer import write_gzip_copy, write_schema
+
+SHARD_BY = ('tag', 'prefix')
+DEFAULT_SHARD = 'default'
+DEFINITIONS_SHARD = 'definitions'
+INDEX_SHARD = 'index'
+OPERATIONS = ('get', 'put', 'post', 'delete', 'options', 'head', 'patch')
+EXTENSIONS = {
+    'json': '.json',
+    'compact': '.json',
+    'yaml': '.yaml',
+    'gzip': '.json.gz',
+}
+
+
+def get_shard_name(path, operation, shard_by='tag'):
+    """
+    :param str path: url path
+    :param dict operation: swagger operation
+    :param str shard_by: 'tag' to use first tag of operation or 'prefix' to use first path segment
+    :return: shard name
+    :rtype: str
+    """
+    if shard_by == 'tag':
+        tags = operation.get('tags')
+        return tags[0] if tags else DEFAULT_SHARD
+
+    for segment in path.split('/'):
+        if segment and not segment.startswith('{'):
+            return segment
+    return DEFAULT_SHARD
+
+
+def rewrite_refs(value, prefix):
+    """
+    Makes copy of value with local definitions references pointing to external document
+
+    :param value: schema part
+    :param str prefix: external document location
+    :return: copy of value
+    """
+    if isinstance(value, dict):
+        result = OrderedDict()
+        for k, v in value.items():
+            if k == '$ref' and isinstance(v, six.string_types) and v.startswith('#/'):
+                v = '{}{}'.format(prefix, v)
+            else:
+                v = rewrite_refs(v, prefix)
+            result[k] = v
+        return result
+    if isinstance(value, (list, tuple)):
+        return [rewrite_refs(v, prefix) for v in value]
+    return value
+
+
+def _get_file_name(name, extension, used_names):
+    base_name = re.sub(r'[^\w.-]+', '_', name).strip('._') or DEFAULT_SHARD
+    file_name = base_name
+    suffix = 1
+    while file_name in used_names:
+        suffix += 1
+        file_name = '{}_{}'.format(base_name, suffix)
+    used_names.add(file_name)
+    return file_name + extension
+
+
+def shard_schema(schema, shard_by='tag', extension='.json'):
+    """
+    Splits schema paths into separate documents which refer to shared definitions document
+
+    :param dict schema: swagger schema
+    :param str shard_by: one of SHARD_BY
+    :param str extension: documents file extension
+    :return: OrderedDict of file name and document, index and definitions documents are first
+    :rtype: OrderedDict
+    """
+    if shard_by not in SHARD_BY:
+        raise ValueError('Unknown shard key: {}'.format(shard_by))
+
+    shard_paths = OrderedDict()
+    for path, path_item in schema.get('paths', {}).items():
+        # plugins may keep methods as they were registered, e.g. 'GET'
+        common = OrderedDict((k, v) for k, v in path_item.items() if k.lower() not in OPERATIONS)
+        for method, operation in path_item.items():
+            if method.lower() not in OPERATIONS:
+                continue
+            name = get_shard_name(path, operation, shard_by)
+            paths = shard_paths.setdefault(name, OrderedDict())
+            if path not in paths:
+                paths[path] = OrderedDict(common)
+            paths[path][method] = operation
+
+    used_names = {INDEX_SHARD, DEFINITIONS_SHARD}
+    definitions_file = DEFINITIONS_SHARD + extension
+    index = OrderedDict([
+        ('swagger', schema.get('swagger')),
+        ('info', schema.get('info')),
+        ('definitions', definitions_file),
+        ('shards', []),
+    ])
+    documents = OrderedDict([
+        (INDEX_SHARD + extension, index),
+        (definitions_file, OrderedDict([('definitions', schema.get('definitions', {}))])),
+    ])
+
+    for name, paths in shard_paths.items():
+        file_name = _get_file_name(name, extension, used_names)
+        document = OrderedDict((k, v) for k, v in schema.items() if k not in ('paths', 'definitions'))
+        document['paths'] = rewrite_refs(paths, definitions_file)
+        documents[file_name] = document
+        index['shards'].append(OrderedDict([
+            ('name', name),
+            ('file', file_name),
+            ('paths', list(paths)),
+        ]))
+
+    return documents
+
+
+def write_shards(schema, directory, shard_by='tag', output_format='json', streaming=False, gzip_copy=False):
+    """
+    Writes sharded schema documents to directory
+
+    :param dict schema: swagger schema
+    :param str directory: output directory
+    :param str shard_by: one of SHARD_BY
+    :param str output_format: one of writer FORMATS
+    :param bool streaming: write JSON by parts
+    :param bool gzip_copy: write gzip-compressed copy of every document
+    :return: paths of written files
+    :rtype: list
+    """
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    written = []
+    for file_name, document in shard_schema(schema, shard_by, EXTENSIONS[output_format]).items():
+        path = os.path.join(directory, file_name)
+        with open(path, 'wb') as f:
+            write_schema(document, f, output_format, streaming)
+        written.append(path)
+        if gzip_copy:
+            written.append(write_gzip_copy(path))
+    return written
@@ -0,0 +1,107 @@
+import time
+
+from .utils import OrderedDict
+
+
+class Timer(object):
+    """
+    Context manager which adds elapsed time to stats phase
+    """
+
+    def __init__(self, stats, phase):
+        self._stats = stats
+        self._phase = phase
+        self._start = None
+
+    def __enter__(self):
+        # keep phases in order of their start
+        self._stats.timings.setdefault(self._phase, 0.0)
+        self._stats._active_phases.add(self._phase)
+        self._start = time.time()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._stats.add_time(self._phase, time.time() - self._start)
+        self._stats._active_phases.discard(self._phase)
+
+
+class _NullTimer(object):
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+_null_timer = _NullTimer()
+
+
+class Stats(object):
+    """
+    Collects phases timings and counters of schema generation.
+    Nested phases (e.g. docstring parsing inside introspection) are included in outer phase time too,
+    recursive entries of the same phase are measured once
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.timings = OrderedDict()
+        self.counters = OrderedDict()
+        self._active_phases = set()
+
+    def timer(self, phase):
+        """
+        :param str phase: phase name
+        :return: context manager which measures phase time
+        """
+        if not self.enabled or phase in self._active_phases:
+            return _null_timer
+        return Timer(self, phase)
+
+    def add_time(self, phase, seconds):
+        """
+        :param str phase: phase name
+        :param float seconds: elapsed time
+        """
+        if self.enabled:
+            self.timings[phase] = self.timings.get(phase, 0.0) + seconds
+
+    def incr(self, counter, value=1):
+        """
+        :param str counter: counter name
+        :param int value: increment
+        """
+        if self.enabled:
+            self.counters[counter] = self.counters.get(counter, 0) + value
+
+    def set(self, counter, value):
+        """
+        :param str counter: counter name
+        :param int value: counter value
+        """
+        if self.enabled:
+            self.counters[counter] = value
+
+    def reset(self):
+        """
+        Remove all timings and counters
+        """
+        self.timings.clear()
+        self.counters.clear()
+
+    def report(self):
+        """
+        :return: human readable report
+        :rtype: str
+        """
+        lines = ['Timings:']
+        for phase, seconds in self.timings.items():
+            lines.append('  {:<32}{:>10.3f}s'.format(phase, seconds))
+        lines.append('Counters:')
+        for counter, value in self.counters.items():
+            lines.append('  {:<32}{:>11}'.format(counter, value))
+        return '\n'.join(lines) + '\n'
+
+
+stats = Stats()
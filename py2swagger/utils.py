@@ -1,3 +1,4 @@
+import functools
 import imp
 import importlib
 import inspect
@@ -6,6 +7,12 @@ import types
 import yaml
 from copy import deepcopy
 from collections import OrderedDict
+from itertools import chain
+
+try:
+    from collections.abc import Mapping, Sequence
+except ImportError:  # pragma: no cover
+    from collections import Mapping, Sequence
 
 # Ability to load and dump yaml as OrderedDict
 from yaml import resolver
@@ -26,19 +33,171 @@ def dict_constructor(loader, node):
 yaml.add_representer(OrderedDict, dict_representer)
 yaml.add_constructor(_mapping_tag, dict_constructor)
 
+# Use libyaml bindings for docstrings parsing if available
+try:
+    from yaml import CSafeLoader as _BaseSafeLoader
+    YAML_ENGINE = 'libyaml'
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _BaseSafeLoader
+    YAML_ENGINE = 'python'
+
+
+class OrderedSafeLoader(_BaseSafeLoader):
+    """
+    Safe yaml loader which constructs mappings as OrderedDict
+    """
+    pass
+
+
+OrderedSafeLoader.add_constructor(_mapping_tag, dict_constructor)
+
 ALLOWED = 'all'
 
 
 class YAMLLoaderMixin(object):
 
+    yaml_engine = YAML_ENGINE
+
     @staticmethod
     def yaml_load(data):
         try:
-            return yaml.load(data)
-        except (yaml.YAMLError, AttributeError):
+            return yaml.load(data, Loader=OrderedSafeLoader)
+        except (yaml.YAMLError, AttributeError, TypeError):
             return None
 
 
+class ListLayers(Sequence):
+    """
+    Read-only view over several lists as over single concatenated list
+    """
+
+    def __init__(self, layers):
+        """
+        :param layers: iterable of lists
+        """
+        self._layers = tuple(layer for layer in layers if layer)
+
+    def __len__(self):
+        return sum(len(layer) for layer in self._layers)
+
+    def __iter__(self):
+        return chain.from_iterable(self._layers)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice) or index < 0:
+            return list(self)[index]
+
+        for layer in self._layers:
+            if index < len(layer):
+                return layer[index]
+            index -= len(layer)
+        raise IndexError('list index out of range')
+
+    def __eq__(self, other):
+        if isinstance(other, (list, ListLayers)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, list(self))
+
+
+class DictLayers(Mapping):
+    """
+    Read-only view over several dicts as over single dict updated by each of them in turn.
+    Keys keep order of first appearance, values are taken from the last dict containing the key
+    """
+
+    def __init__(self, layers):
+        """
+        :param layers: iterable of dicts
+        """
+        self._layers = tuple(layer for layer in layers if layer)
+        self._keys = None
+
+    def __getitem__(self, key):
+        for layer in reversed(self._layers):
+            if key in layer:
+                return layer[key]
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return any(key in layer for layer in self._layers)
+
+    def __iter__(self):
+        return iter(self._get_keys())
+
+    def __len__(self):
+        return len(self._get_keys())
+
+    def _get_keys(self):
+        if self._keys is None:
+            self._keys = list(OrderedDict.fromkeys(chain.from_iterable(self._layers)))
+        return self._keys
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, OrderedDict(self))
+
+
+def memoized_property(f):
+    """
+    Property which value is computed once per instance.
+    Values are stored in instance "_memoized" dict, clear it to recompute values
+
+    :param f: property getter
+    """
+    @functools.wraps(f)
+    def getter(self):
+        memoized = self.__dict__.setdefault('_memoized', {})
+        # getter itself is a key, so overridden properties in subclasses are cached separately
+        try:
+            return memoized[getter]
+        except KeyError:
+            value = memoized[getter] = f(self)
+            return value
+
+    return property(getter)
+
+
+def merge_layers(layers):
+    """
+    Merges values without copying.
+    Lists are concatenated, dicts are updated, for other types first value wins
+
+    :param list layers: values to merge
+    :return: value, ListLayers or DictLayers
+    """
+    if len(layers) == 1:
+        return layers[0]
+
+    first = layers[0]
+    if isinstance(first, list):
+        return ListLayers(layer for layer in layers if isinstance(layer, list))
+    elif isinstance(first, dict):
+        return DictLayers(layer for layer in layers if isinstance(layer, dict))
+    return first
+
+
+def materialize(value):
+    """
+    Converts layers view to regular list or OrderedDict
+
+    :param value: any value
+    :return: value, list or OrderedDict
+    """
+    if isinstance(value, ListLayers):
+        return list(value)
+    elif isinstance(value, DictLayers):
+        return OrderedDict(value)
+    return value
+
+
 def flatten(seq):
     l = []
     for elt in seq:
@@ -0,0 +1,206 @@
+import logging
+import os
+import sys
+import time
+import types
+
+import six
+from six.moves import reload_module
+
+logger = logging.getLogger(__name__)
+
+IGNORED_DIRS = ('__pycache__', 'node_modules')
+# modules which state should survive reloads
+IGNORED_PACKAGES = ('py2swagger',)
+
+
+def _get_source_path(module):
+    path = getattr(module, '__file__', None)
+    if not path:
+        return None
+    if path.endswith(('.pyc', '.pyo')):
+        path = path[:-1]
+    return os.path.abspath(path)
+
+
+def _get_module_dependencies(module):
+    """
+    :param module: module
+    :return: names of modules which objects are used in module namespace
+    :rtype: set
+    """
+    dependencies = set()
+    for value in list(vars(module).values()):
+        if isinstance(value, types.ModuleType):
+            dependencies.add(value.__name__)
+        else:
+            module_name = getattr(value, '__module__', None)
+            if isinstance(module_name, six.string_types):
+                dependencies.add(module_name)
+    dependencies.discard(module.__name__)
+    return dependencies
+
+
+class ModuleWatcher(object):
+    """
+    Polls python files of project for changes and reloads changed modules
+    with modules which depend on them
+    """
+
+    def __init__(self, root, interval=1.0):
+        """
+        :param str root: project root path
+        :param float interval: polling interval in seconds
+        """
+        self.root = os.path.abspath(root)
+        self.interval = interval
+        self._mtimes = self.snapshot()
+
+    def snapshot(self):
+        """
+        :return: modification times of project python files
+        :rtype: dict
+        """
+        mtimes = {}
+        for dir_path, dir_names, file_names in os.walk(self.root):
+            dir_names[:] = [d for d in dir_names if not d.startswith('.') and d not in IGNORED_DIRS]
+            for file_name in file_names:
+                if file_name.endswith('.py'):
+                    path = os.path.join(dir_path, file_name)
+                    try:
+                        mtimes[path] = os.stat(path).st_mtime
+                    except OSError:
+                        # file was removed during walk
+                        pass
+        return mtimes
+
+    def poll(self):
+        """
+        :return: paths of changed, created and removed files since previous poll
+        :rtype: set
+        """
+        mtimes = self.snapshot()
+        changed = set(
+            path for path in set(mtimes) | set(self._mtimes)
+            if mtimes.get(path) != self._mtimes.get(path)
+        )
+        self._mtimes = mtimes
+        return changed
+
+    def wait(self, stop=None):
+        """
+        Waits for changes
+
+        :param stop: callable which returns True to stop waiting
+        :return: changed paths or empty set if stopped
+        :rtype: set
+        """
+        while not (stop and stop()):
+            changed = self.poll()
+            if changed:
+                return changed
+            time.sleep(self.interval)
+        return set()
+
+    def get_project_modules(self):
+        """
+        :return: loaded modules defined in project files by name
+        :rtype: dict
+        """
+        modules = {}
+        for name, module in list(sys.modules.items()):
+            if module is None or name == '__main__' or name.split('.')[0] in IGNORED_PACKAGES:
+                continue
+            path = _get_source_path(module)
+            if path and path.startswith(self.root + os.sep):
+                modules[name] = module
+        return modules
+
+    def get_affected_modules(self, paths):
+        """
+        :param paths: changed files
+        :return: names of modules defined in changed files and modules which depend on them,
+            dependencies go first
+        :rtype: list
+        """
+        paths = set(os.path.abspath(p) for p in paths)
+        modules = self.get_project_modules()
+        dependencies = dict((name, _get_module_dependencies(m) & set(modules)) for name, m in modules.items())
+
+        dependents = {}
+        for name, names in dependencies.items():
+            for dependency in names:
+                dependents.setdefault(dependency, set()).add(name)
+
+        affected = set()
+        stack = [name for name, m in modules.items() if _get_source_path(m) in paths]
+        while stack:
+            name = stack.pop()
+            if name not in affected:
+                affected.add(name)
+                stack.extend(dependents.get(name, ()))
+
+        # order modules so that dependencies are reloaded before their dependents
+        ordered = []
+        visited = set()
+        for name in sorted(affected):
+            stack = [(name, False)]
+            while stack:
+                name, processed = stack.pop()
+                if processed:
+                    ordered.append(name)
+                    continue
+                if name in visited:
+                    continue
+                visited.add(name)
+                stack.append((name, True))
+                stack.extend((d, False) for d in sorted(dependencies[name] & affected) if d not in visited)
+        return ordered
+
+    def reload(self, paths):
+        """
+        Reloads modules affected by changed files
+
+        :param paths: changed files
+        :return: names of reloaded modules
+        :rtype: list
+        """
+        reloaded = []
+        for name in self.get_affected_modules(paths):
+            module = sys.modules.get(name)
+            if module is None:
+                continue
+            try:
+                reload_module(module)
+            except ImportError as e:
+                # e.g. configuration file which is not importable by name and loaded again on build
+                logger.debug('Could not reload module %s: %s', name, e)
+                continue
+            reloaded.append(name)
+        return reloaded
+
+
+def watch(build, root, interval=1.0, stop=None):
+    """
+    Calls build on every change of project files after reloading affected modules.
+    Errors of reloading and building are logged and watching continues
+
+    :param build: callable without arguments
+    :param str root: project root path
+    :param float interval: polling interval in seconds
+    :param stop: callable which returns True to stop watching
+    """
+    watcher = ModuleWatcher(root, interval)
+    logger.info('Watching %s for changes', watcher.root)
+
+    while True:
+        changed = watcher.wait(stop)
+        if not changed:
+            return
+
+        try:
+            reloaded = watcher.reload(changed)
+            logger.info('Reloaded modules: %s', ', '.join(reloaded) or '-')
+            build()
+        except Exception:
+            logger.exception('Schema regeneration failed')
@@ -0,0 +1,166 @@
+import codecs
+import gzip
+import json
+import shutil
+
+import six
+import yaml
+
+# registers OrderedDict representer
+from . import utils  # noqa
+
+STREAMED_KEYS = ('paths', 'definitions')
+FORMATS = ('json', 'compact', 'yaml', 'gzip')
+
+
+class SchemaDumper(yaml.Dumper):
+    """
+    Dumper which writes shared objects (e.g. equal definitions) in place instead of aliases
+    """
+
+    def ignore_aliases(self, data):
+        return True
+
+
+if six.PY2:
+    # plain scalars instead of !!python/unicode tags
+    SchemaDumper.add_representer(six.text_type, yaml.representer.SafeRepresenter.represent_unicode)
+
+
+def _encode_key(key):
+    if not isinstance(key, six.string_types):
+        # the same conversion as json module does for non-string keys
+        key = json.dumps(key)
+    return json.dumps(key)
+
+
+def iterencode(schema, indent=2, compact=False, streamed_keys=STREAMED_KEYS):
+    """
+    Encodes schema to JSON by parts: every top-level property and every item
+    of paths and definitions is encoded separately, so encoded schema
+    is never kept in memory entirely. Result is the same as of json.dumps
+
+    :param dict schema: swagger schema
+    :param int indent: indentation. Ignored for compact output
+    :param bool compact: use no indentation and minimal separators
+    :param streamed_keys: top-level properties which items are encoded separately
+    :return: generator of JSON chunks
+    """
+    if compact:
+        indent = None
+        separators = (',', ':')
+    else:
+        separators = (',', ': ')
+
+    def encode(value, depth):
+        chunk = json.dumps(value, indent=indent, separators=separators)
+        if indent is not None and depth:
+            # JSON strings never contain raw newlines, so only structure is reindented
+            chunk = chunk.replace('\n', '\n' + ' ' * indent * depth)
+        return chunk
+
+    def iter_mapping(mapping, depth, streamed):
+        if not mapping:
+            yield '{}'
+            return
+
+        if indent is None:
+            newline = closing_newline = ''
+        else:
+            newline = '\n' + ' ' * indent * (depth + 1)
+            closing_newline = '\n' + ' ' * indent * depth
+
+        item_separator = '{'
+        for key, value in mapping.items():
+            yield item_separator + newline + _encode_key(key) + separators[1]
+            item_separator = separators[0]
+
+            if key in streamed and isinstance(value, dict):
+                for chunk in iter_mapping(value, depth + 1, ()):
+                    yield chunk
+            else:
+                yield encode(value, depth + 1)
+
+        yield closing_newline + '}'
+
+    return iter_mapping(schema, 0, streamed_keys)
+
+
+def write_json(schema, stream, indent=2, compact=False, chunk_size=64 * 1024):
+    """
+    Writes schema to stream by chunks
+
+    :param dict schema: swagger schema
+    :param stream: file-like object opened in text mode
+    :param int indent: indentation. Ignored for compact output
+    :param bool compact: use no indentation and minimal separators
+    :param int chunk_size: minimal size of single write
+    """
+    buffer = []
+    size = 0
+
+    for chunk in iterencode(schema, indent=indent, compact=compact):
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= chunk_size:
+            stream.write(''.join(buffer))
+            buffer = []
+            size = 0
+
+    if buffer:
+        stream.write(''.join(buffer))
+
+
+def write_yaml(schema, stream):
+    """
+    :param dict schema: swagger schema
+    :param stream: file-like object opened in text mode
+    """
+    # without encoding python 2 yaml writes utf-8 bytes into text stream
+    yaml.dump(schema, stream, Dumper=SchemaDumper, default_flow_style=False, allow_unicode=True, encoding=None)
+
+
+def write_schema(schema, stream, output_format='json', streaming=False):
+    """
+    Writes schema in given format
+
+    :param dict schema: swagger schema
+    :param stream: file-like object opened in binary mode
+    :param str output_format: one of FORMATS. 'gzip' is gzip-compressed compact JSON
+    :param bool streaming: write JSON by parts instead of encoding it entirely in memory
+    """
+    if output_format not in FORMATS:
+        raise ValueError('Unknown output format: {}'.format(output_format))
+
+    if output_format == 'gzip':
+        with gzip.GzipFile(fileobj=stream, mode='wb') as gzip_stream:
+            write_schema(schema, gzip_stream, 'compact', streaming)
+        return
+
+    writer = codecs.getwriter('utf-8')(stream)
+
+    if output_format == 'yaml':
+        write_yaml(schema, writer)
+        return
+
+    compact = output_format == 'compact'
+    if streaming:
+        write_json(schema, writer, compact=compact)
+    elif compact:
+        writer.write(json.dumps(schema, separators=(',', ':')))
+    else:
+        writer.write(json.dumps(schema, indent=2, separators=(',', ': ')))
+
+
+def write_gzip_copy(path):
+    """
+    Writes gzip-compressed copy of file next to it
+
+    :param str path: file path
+    :return: path of compressed file
+    :rtype: str
+    """
+    gzip_path = '{}.gz'.format(path)
+    with open(path, 'rb') as src, gzip.open(gzip_path, 'wb') as dst:
+        shutil.copyfileobj(src, dst)
+    return gzip_path
@@ -1,39 +1,147 @@
 import re
 
-from .utils import OrderedDict, YAMLLoaderMixin
+from .cache import docstring_cache
+from .stats import stats
+from .utils import OrderedDict, YAMLLoaderMixin, merge_layers
+
+YAML_SEPARATOR = re.compile(r'\s*---+\s*\n')
 
 
 class YAMLDocstringParser(YAMLLoaderMixin):
     """
     YAML docstring parser
+
+    Summary and description are parsed immediately,
+    yaml sections are parsed on first access to schema
     """
 
     def __init__(self, docstring=''):
         self.doc = docstring or ''
 
-        self.summary, self.description, self.schema = self._parse_docstring(self.doc)
+        self.summary, self.description = None, None
+        self._schema = None
+        self._schema_layers = []
+        self._pending_docstrings = []
+        self._add_docstring(self.doc)
+
+    @property
+    def schema(self):
+        """
+        Schema merged from yaml sections of all docstrings.
+        Merged lists and dicts are read-only views over parsed yaml sections
+
+        :rtype: OrderedDict
+        """
+        if self._pending_docstrings:
+            docstrings, self._pending_docstrings = self._pending_docstrings, []
+            for docstring in docstrings:
+                schema = self._parse_docstring(docstring)[2]
+                if schema and isinstance(schema, dict):
+                    self._schema_layers.append(schema)
+            self._schema = None
+
+        if self._schema is None:
+            self._schema = self._merge_schema_layers(self._schema_layers)
+        return self._schema
+
+    def _add_docstring(self, docstring):
+        """
+        Updates summary and description, postpones yaml section parsing
+
+        :param docstring:
+        """
+        if not docstring:
+            return
+
+        summary, description = self._parse_head(self._split_docstring(docstring)[0])
+
+        self.summary = summary or self.summary
+        self.description = description or self.description
+
+        if '---' in docstring:
+            self._pending_docstrings.append(docstring)
+
+    @staticmethod
+    def _merge_schema_layers(layers):
+        """
+        :param list layers: schemas parsed from docstrings
+        :return: merged schema
+        :rtype: OrderedDict
+        """
+        values = OrderedDict()
+        for layer in layers:
+            for k, v in layer.items():
+                values.setdefault(k, []).append(v)
+
+        return OrderedDict((k, merge_layers(v)) for k, v in values.items())
 
     def _parse_docstring(self, docstring=''):
+        """
+        Parse docstring using process-wide cache
+        Docstrings without yaml section are parsed without cache and yaml loader
+
+        :param docstring:
+        :return: (summary, description, schema)
+        """
+        if not docstring:
+            return None, None, dict()
+
+        if '---' not in docstring:
+            summary, description = self._parse_head(docstring)
+            return summary, description, dict()
+
+        result = docstring_cache.get(docstring)
+        if result is None:
+            with stats.timer('docstring parsing'):
+                result = self._parse_docstring_uncached(docstring)
+            stats.incr('docstrings parsed')
+            docstring_cache.set(docstring, result)
+        return result
+
+    def _parse_docstring_uncached(self, docstring=''):
         """
         :param docstring:
         :return: (summary, description, schema)
         """
-        summary, description, schema = None, None, dict()
+        schema = dict()
+        head, yml = self._split_docstring(docstring)
+
+        if yml:
+            schema = self.yaml_load(yml) or dict()
+
+        summary, description = self._parse_head(head)
+        return summary, description, schema
+
+    @staticmethod
+    def _split_docstring(docstring):
+        """
+        :param docstring:
+        :return: (head, yaml section)
+        """
         docstring = docstring.strip()
 
         if '---' in docstring:
-            head, yml = re.split(r'\s*---+\s*\n', docstring)
-            if yml:
-                schema = self.yaml_load(yml) or dict()
+            head, yml = YAML_SEPARATOR.split(docstring)
         else:
-            head = docstring
+            head, yml = docstring, None
+
+        return head, yml
 
-        if '\n' in head.strip():
+    @staticmethod
+    def _parse_head(head):
+        """
+        :param head: docstring part before yaml section
+        :return: (summary, description)
+        """
+        summary, description = None, None
+        head = head.strip()
+
+        if '\n' in head:
             summary, description = map(lambda s: s.strip(), head.split('\n', 1))
         elif head:
-            summary = head.strip()
+            summary = head
 
-        return summary, description, schema
+        return summary, description
 
     def get_description(self):
         """
@@ -137,21 +245,18 @@ class YAMLDocstringParser(YAMLLoaderMixin):
         Update parser with another docstring
         :param docstring:
         """
-        if docstring is None:
-            docstring = ''
-        summary, description, schema = self._parse_docstring(docstring)
+        self._add_docstring(docstring)
+
+
+class FrozenYAMLDocstringParser(YAMLDocstringParser):
+    """
+    YAML docstring parser which could not be updated.
+    Instances are safe to share between introspectors
+    """
+
+    def update(self, docstring=''):
+        raise TypeError('{} could not be updated'.format(self.__class__.__name__))
 
-        # update summary
-        self.summary = summary or self.summary
-        # update description
-        self.description = description or self.description
 
-        # update schema
-        for k, v in schema.items():
-            if k not in self.schema:
-                self.schema[k] = v
-            else:
-                if isinstance(v, list):
-                    self.schema[k].extend(v)
-                elif isinstance(v, (dict, OrderedDict)):
-                    self.schema[k].update(v)
+#: Shared parser for objects without docstrings
+EMPTY_PARSER = FrozenYAMLDocstringParser()
@@ -0,0 +1,5 @@
+"""
+Benchmarks of schema generation for synthetic projects. Run:
+
+    python -m tests.benchmarks --framework simple drf --endpoints 1000 --output results.json
+"""
@@ -0,0 +1,48 @@
+import argparse
+import json
+import logging
+import sys
+
+from .generator import FRAMEWORKS, ProjectOptions
+from .runner import run_isolated, run_single
+
+
+def main():
+    parser = argparse.ArgumentParser(description='py2swagger benchmarks')
+    parser.add_argument('--framework', nargs='+', choices=FRAMEWORKS, default=['simple'])
+    parser.add_argument('--endpoints', type=int, default=100)
+    parser.add_argument('--serializers', type=int, default=20)
+    parser.add_argument('--depth', type=int, default=3)
+    parser.add_argument('--mixins', type=int, default=3)
+    parser.add_argument('--docstring-size', type=int, default=5)
+    parser.add_argument('--repeat', type=int, default=1, help='Number of runs of every benchmark')
+    parser.add_argument('-o', '--output', help='Results file (Default stdout)')
+    parser.add_argument('--single', action='store_true', help='Run single benchmark in current process')
+    args = parser.parse_args()
+
+    # keep stdout for results only
+    logging.disable(logging.WARNING)
+
+    options = ProjectOptions(
+        endpoints=args.endpoints,
+        serializers=args.serializers,
+        depth=args.depth,
+        mixins=args.mixins,
+        docstring_size=args.docstring_size,
+    )
+
+    if args.single:
+        results = run_single(args.framework[0], options)
+    else:
+        results = [run_isolated(framework, options) for framework in args.framework for _ in range(args.repeat)]
+
+    output = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+    else:
+        sys.stdout.write(output + '\n')
+
+
+if __name__ == '__main__':
+    main()
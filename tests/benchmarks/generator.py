@@ -0,0 +1,246 @@
+"""
+Generates synthetic projects for benchmarks
+"""
+import os
+import textwrap
+
+FRAMEWORKS = ('simple', 'falcon', 'drf')
+
+
+class ProjectOptions(object):
+    """
+    Synthetic project size
+    """
+
+    def __init__(self, endpoints=100, serializers=20, depth=3, mixins=3, docstring_size=5):
+        """
+        :param int endpoints: number of endpoints
+        :param int serializers: number of distinct serializers (schemas) shared by endpoints
+        :param int depth: nesting depth of serializers
+        :param int mixins: number of documented mixins of every view
+        :param int docstring_size: number of parameters described in every docstring
+        """
+        self.endpoints = endpoints
+        self.serializers = max(1, serializers)
+        self.depth = max(1, depth)
+        self.mixins = mixins
+        self.docstring_size = docstring_size
+
+    def as_dict(self):
+        return dict(vars(self))
+
+
+def _indent(text, level):
+    return textwrap.indent(text, '    ' * level) if hasattr(textwrap, 'indent') else \
+        '\n'.join(('    ' * level + line) if line else line for line in text.split('\n'))
+
+
+def _yaml_schema(serializer, depth):
+    lines = []
+    for level in range(depth):
+        prefix = '  ' * (level * 3)
+        lines.extend([
+            '{}schema:'.format(prefix),
+            '{}  id: Schema{}Level{}'.format(prefix, serializer, level),
+            '{}  type: object'.format(prefix),
+            '{}  properties:'.format(prefix),
+            '{}    name:'.format(prefix),
+            '{}      type: string'.format(prefix),
+            '{}    child:'.format(prefix),
+        ])
+    lines.append('{}  type: string'.format('  ' * (depth * 3)))
+    return '\n'.join(lines)
+
+
+def make_docstring(name, options, serializer=None, tag=None):
+    """
+    :param str name: documented object name
+    :param ProjectOptions options: project size
+    :param int serializer: number of response schema
+    :param str tag: operation tag
+    :return: yaml docstring
+    :rtype: str
+    """
+    lines = [
+        '{} summary'.format(name),
+        '',
+        'Description of {}'.format(name),
+        '---',
+    ]
+    if tag:
+        lines.extend(['tags:', '- {}'.format(tag)])
+
+    if options.docstring_size:
+        lines.append('parameters:')
+        for i in range(options.docstring_size):
+            lines.extend([
+                '- in: query',
+                '  name: {}_param{}'.format(name.lower(), i),
+                '  type: string',
+                '  description: Parameter {} of {}'.format(i, name),
+            ])
+
+    if serializer is not None:
+        lines.extend([
+            'responses:',
+            '  200:',
+            '    description: Success',
+            _indent(_yaml_schema(serializer, options.depth), 1),
+        ])
+
+    return '\n'.join(lines)
+
+
+def _quoted_docstring(docstring, level):
+    return _indent('"""\n{}\n"""'.format(docstring), level)
+
+
+def _mixins_source(options):
+    parts = []
+    for i in range(options.mixins):
+        docstring = make_docstring('Mixin{}'.format(i), options)
+        parts.append('class Mixin{}(object):\n{}\n'.format(i, _quoted_docstring(docstring, 1)))
+    return '\n\n'.join(parts)
+
+
+def _bases(options, *extra):
+    return ', '.join(['Mixin{}'.format(i) for i in range(options.mixins)] + list(extra)) or 'object'
+
+
+def _write(directory, name, content):
+    path = os.path.join(directory, name)
+    with open(path, 'w') as f:
+        f.write(content)
+    return path
+
+
+def generate_simple(directory, options):
+    """
+    Generates project for simple plugin: views module and configuration file
+
+    :return: plugin arguments and settings
+    :rtype: dict
+    """
+    views = [_mixins_source(options)]
+    endpoints = []
+    for i in range(options.endpoints):
+        name = 'View{}'.format(i)
+        docstring = make_docstring(name, options, i % options.serializers, 'tag{}'.format(i % 10))
+        views.append('class {}({}):\n{}\n'.format(name, _bases(options), _quoted_docstring(docstring, 1)))
+        endpoints.append(('/items{}/{{id}}'.format(i), 'get', 'simple_views.{}'.format(name)))
+
+    _write(directory, 'simple_views.py', '\n\n'.join(views))
+    config = _write(directory, 'simple_config.py', 'PLUGIN_SETTINGS = {{\'endpoints\': {!r}}}\n'.format(endpoints))
+    return {'config': config, 'arguments': {}}
+
+
+def generate_falcon(directory, options):
+    """
+    Generates falcon application module
+
+    :return: plugin arguments and settings
+    :rtype: dict
+    """
+    parts = ['import falcon', _mixins_source(options)]
+    routes = []
+    for i in range(options.endpoints):
+        name = 'Resource{}'.format(i)
+        methods = []
+        for method in ('get', 'post'):
+            docstring = make_docstring(
+                '{}_{}'.format(name, method), options, i % options.serializers, 'tag{}'.format(i % 10))
+            methods.append('    def on_{}(self, req, resp, id):\n{}\n        pass\n'.format(
+                method, _quoted_docstring(docstring, 2)))
+        parts.append('class {}({}):\n{}'.format(name, _bases(options), '\n'.join(methods)))
+        routes.append('app.add_route(\'/items{}/{{id}}\', {}())'.format(i, name))
+
+    parts.append('app = falcon.App() if hasattr(falcon, \'App\') else falcon.API()\n' + '\n'.join(routes) + '\n')
+    _write(directory, 'falcon_bench_app.py', '\n\n'.join(parts))
+    return {'config': None, 'arguments': {'app': 'falcon_bench_app:app'}}
+
+
+def generate_drf(directory, options):
+    """
+    Generates django project with rest framework views and nested serializers
+
+    :return: plugin arguments and settings
+    :rtype: dict
+    """
+    _write(directory, 'drf_bench_settings.py', textwrap.dedent("""
+        SECRET_KEY = 'benchmark'
+        INSTALLED_APPS = [
+            'django.contrib.auth',
+            'django.contrib.contenttypes',
+            'rest_framework',
+        ]
+        DATABASES = {'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'}}
+        ROOT_URLCONF = 'drf_bench_urls'
+    """))
+
+    serializers = ['from rest_framework import serializers']
+    for i in range(options.serializers):
+        for level in reversed(range(options.depth)):
+            fields = [
+                '    name = serializers.CharField(help_text=\'Name\')',
+                '    count = serializers.IntegerField(required=False)',
+            ]
+            if level < options.depth - 1:
+                fields.append('    child = Serializer{}Level{}(many=True)'.format(i, level + 1))
+            serializers.append('class Serializer{}Level{}(serializers.Serializer):\n{}\n'.format(
+                i, level, '\n'.join(fields)))
+    _write(directory, 'drf_bench_serializers.py', '\n\n'.join(serializers))
+
+    views = [
+        'from rest_framework import generics\nfrom rest_framework.response import Response\n'
+        'import drf_bench_serializers',
+        _mixins_source(options),
+    ]
+    urls = []
+    for i in range(options.endpoints):
+        name = 'View{}'.format(i)
+        methods = []
+        for method in ('get', 'post'):
+            docstring = make_docstring('{}_{}'.format(name, method), options, tag='tag{}'.format(i % 10))
+            methods.append('    def {}(self, request, pk):\n{}\n        return Response()\n'.format(
+                method, _quoted_docstring(docstring, 2)))
+        views.append('class {}({}):\n{}\n    serializer_class = drf_bench_serializers.Serializer{}Level0\n\n{}'.format(
+            name, _bases(options, 'generics.GenericAPIView'),
+            _quoted_docstring(make_docstring(name, options), 1), i % options.serializers, '\n'.join(methods)))
+        urls.append('    url(r\'^items{}/(?P<pk>[0-9]+)$\', drf_bench_views.{}.as_view()),'.format(i, name))
+    _write(directory, 'drf_bench_views.py', '\n\n'.join(views))
+
+    _write(directory, 'drf_bench_urls.py', textwrap.dedent("""
+        try:
+            from django.conf.urls import url
+        except ImportError:
+            from django.urls import re_path as url
+
+        import drf_bench_views
+
+        urlpatterns = [
+        {}
+        ]
+    """).format('\n'.join(urls)))
+    return {'config': None, 'arguments': {'django_settings': 'drf_bench_settings', 'filter': None}}
+
+
+GENERATORS = {
+    'simple': generate_simple,
+    'falcon': generate_falcon,
+    'drf': generate_drf,
+}
+
+
+def generate(framework, directory, options):
+    """
+    Generates synthetic project
+
+    :param str framework: one of FRAMEWORKS
+    :param str directory: project directory
+    :param ProjectOptions options: project size
+    :return: configuration file path and plugin arguments
+    :rtype: dict
+    """
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    return GENERATORS[framework](directory, options)
@@ -0,0 +1,119 @@
+"""
+Runs schema generation for synthetic project and measures it
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+try:
+    import tracemalloc
+except ImportError:  # pragma: no cover
+    # python 2
+    tracemalloc = None
+
+from py2swagger import __version__, build_schema
+from py2swagger.stats import stats
+
+from .generator import generate
+
+PLUGINS = {
+    'simple': 'py2swagger.plugins.simple:SimplePlugin',
+    'falcon': 'py2swagger.plugins.falcon:FalconPy2SwaggerPlugin',
+    'drf': 'py2swagger.plugins.drf:DjangoPlugin',
+}
+
+
+def _load_plugin(framework):
+    module_name, class_name = PLUGINS[framework].split(':')
+    module = __import__(module_name, fromlist=[class_name])
+    return getattr(module, class_name)()
+
+
+def run_benchmark(framework, directory, options):
+    """
+    Generates project and builds its schema in current process
+
+    :param str framework: one of generator FRAMEWORKS
+    :param str directory: project directory
+    :param ProjectOptions options: project size
+    :return: measurements
+    :rtype: dict
+    """
+    project = generate(framework, directory, options)
+    sys.path.insert(0, directory)
+
+    arguments = argparse.Namespace(config=project['config'], preparse=None, **project['arguments'])
+    plugin = _load_plugin(framework)
+
+    stats.reset()
+    stats_enabled, stats.enabled = stats.enabled, True
+    if tracemalloc is not None:
+        tracemalloc.start()
+
+    try:
+        start = time.time()
+        builder = build_schema(plugin, arguments)
+        serialized = json.dumps(builder.schema)
+        wall_time = time.time() - start
+    finally:
+        peak_memory = None
+        if tracemalloc is not None:
+            peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        stats.enabled = stats_enabled
+        sys.path.remove(directory)
+
+    counters = dict(stats.counters)
+    counters['paths'] = len(builder.schema['paths'])
+    counters['definitions'] = len(builder.schema['definitions'])
+    counters['schema size'] = len(serialized)
+
+    return {
+        'framework': framework,
+        'options': options.as_dict(),
+        'py2swagger': __version__,
+        'python': platform.python_version(),
+        'wall_time': wall_time,
+        'peak_memory': peak_memory,
+        'phases': dict(stats.timings),
+        'counters': counters,
+    }
+
+
+def run_isolated(framework, options):
+    """
+    Runs benchmark in separate process, so every run starts with cold caches
+    and without modules loaded by other benchmarks
+
+    :param str framework: one of generator FRAMEWORKS
+    :param ProjectOptions options: project size
+    :return: measurements
+    :rtype: dict
+    """
+    command = [sys.executable, '-m', 'tests.benchmarks', '--single', '--framework', framework]
+    for name, value in sorted(options.as_dict().items()):
+        command.extend(['--{}'.format(name.replace('_', '-')), str(value)])
+
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    output = subprocess.check_output(command, cwd=root)
+    return json.loads(output.decode('utf-8'))
+
+
+def run_single(framework, options):
+    """
+    Runs benchmark in temporary directory of current process
+
+    :return: measurements
+    :rtype: dict
+    """
+    directory = tempfile.mkdtemp(prefix='py2swagger-benchmark-')
+    try:
+        return run_benchmark(framework, directory, options)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
@@ -1,11 +1,15 @@
+import json
+from decimal import Decimal
+
 from django.test import TestCase
+from django.utils.translation import ugettext_lazy
 from . import patterns
 from django.conf.urls import url
 from rest_framework import routers
 
 from py2swagger.plugins.drf.injection import viewset_as_view_decorator
 from py2swagger.plugins.drf.urlparser import UrlParser
-from py2swagger.plugins.drf.introspectors.api import ApiIntrospector
+from py2swagger.plugins.drf.introspectors.api import ApiIntrospector, LazyEncoder, normalize
 from py2swagger.plugins.drf.introspectors.view import ApiViewIntrospector, ViewSetIntrospector, WrappedApiViewIntrospector, get_view_introspector
 from . import REST_FRAMEWORK_V35
 
@@ -56,6 +60,12 @@ class ApiIntrospectorTestCase(TestCase, ApiIntrospectorMixin):
             introspector = get_view_introspector(self.apis[2])
             self.assertTrue(isinstance(introspector, WrappedApiViewIntrospector), 'Invalid introspector instance')
 
+    def test_inspect_jobs(self):
+        expected = ApiIntrospector(self.apis).inspect()
+        introspector = ApiIntrospector(self.apis, jobs=2)
+        self.assertEqual(expected, introspector.inspect())
+        self.assertEqual(self.api_introspector.serializers, introspector.serializers)
+
 
 class ContentIntrospectorTestCase(TestCase, ApiIntrospectorMixin):
     def setUp(self):
@@ -92,3 +102,22 @@ class ContentIntrospectorTestCase(TestCase, ApiIntrospectorMixin):
 
         self.assertEqual([], content)
 
+
+
+class NormalizeTestCase(TestCase):
+    def test_normalize(self):
+        value = {
+            200: {'description': ugettext_lazy('Success'), 'default': Decimal('1.5')},
+            'enum': ('a', 'b'),
+            'required': True,
+        }
+        result = normalize(value)
+        self.assertEqual(json.loads(json.dumps(value, cls=LazyEncoder)), result)
+        self.assertEqual(['a', 'b'], result['enum'])
+        self.assertEqual('Success', result['200']['description'])
+
+    def test_normalize_copy(self):
+        value = {'parameters': [{'name': 'id'}]}
+        result = normalize(value)
+        result['parameters'][0]['name'] = 'pk'
+        self.assertEqual('id', value['parameters'][0]['name'])
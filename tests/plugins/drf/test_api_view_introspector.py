@@ -3,7 +3,7 @@ from . import patterns
 
 from django.conf.urls import url
 
-from py2swagger.plugins.drf.introspectors.view import ApiViewIntrospector
+from py2swagger.plugins.drf.introspectors.view import ApiViewIntrospector, get_allowed_methods
 from py2swagger.plugins.drf.introspectors.method import ApiViewMethodIntrospector
 
 from testapp.views import EmailApiView
@@ -28,3 +28,13 @@ class ApiViewIntrospectorTestCase(TestCase):
         methods = self.introspector.methods()
         for method in methods:
             self.assertTrue(isinstance(method, ApiViewMethodIntrospector))
+
+    def test_allowed_methods(self):
+        self.assertEqual(EmailApiView().allowed_methods, get_allowed_methods(EmailApiView))
+
+        class CustomAllowedMethodsView(EmailApiView):
+            @property
+            def allowed_methods(self):
+                return ['GET']
+
+        self.assertEqual(['GET'], get_allowed_methods(CustomAllowedMethodsView))
@@ -67,3 +67,9 @@ class AuthenticationIntrospectorMethodsTestCase(TestCase):
 
         self.assertTrue(isinstance(introspectors[0], BasicAuthenticationIntrospector))
         self.assertTrue(isinstance(introspectors[1], TokenAuthenticationIntrospector))
+
+    def test_get_introspectors_shared(self):
+        instance = TestGetAuthIntrospectorsView()
+        introspectors = get_authentication_introspectors(instance)
+
+        self.assertEqual(introspectors, get_authentication_introspectors(instance))
@@ -0,0 +1,105 @@
+import os
+import shutil
+import tempfile
+
+from django.conf.urls import url
+from django.test import TestCase
+
+from py2swagger.plugins.drf.injection import viewset_as_view_decorator
+from py2swagger.plugins.drf.introspectors.api import ApiIntrospector
+from py2swagger.plugins.drf.manifest import Manifest
+from py2swagger.plugins.drf.urlparser import UrlParser
+from . import patterns
+
+from testapp.views import EmailApiView, CustomViewSet
+from testapp.serializers import TestModelSeriazlizer
+
+
+class ManifestTestCase(TestCase):
+
+    def setUp(self):
+        CustomViewSet.as_view = viewset_as_view_decorator(CustomViewSet.as_view)
+        url_patterns = patterns(
+            '',
+            url(r'a-view$', EmailApiView.as_view()),
+            url(r'b-view$', CustomViewSet.as_view({'get': 'list'})),
+        )
+        self.apis = UrlParser().get_apis(url_patterns=url_patterns)
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, 'manifest.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_reuse(self):
+        manifest = Manifest(self.path)
+        expected = ApiIntrospector(self.apis, manifest).inspect()
+        self.assertEqual(2, manifest.save())
+
+        manifest = Manifest(self.path)
+        self.assertEqual(2, manifest.load())
+        introspector = ApiIntrospector(self.apis, manifest)
+        introspector.inspect_api = None
+
+        self.assertEqual(expected, introspector.inspect())
+
+    def test_fingerprint(self):
+        manifest = Manifest(self.path)
+        fingerprint = manifest.get_fingerprint(self.apis[0])
+
+        self.assertEqual(fingerprint, Manifest(self.path).get_fingerprint(self.apis[0]))
+        self.assertNotEqual(fingerprint, manifest.get_fingerprint(self.apis[1]))
+        self.assertNotEqual(fingerprint, manifest.get_fingerprint(self.apis[0], [TestModelSeriazlizer]))
+
+    def test_changed_model(self):
+        from testapp import models
+
+        manifest = Manifest(self.path)
+        fingerprint = manifest.get_fingerprint(self.apis[0], [TestModelSeriazlizer])
+        self.assertIn(models.__name__, manifest._get_modules(self.apis[0]['callback'], [TestModelSeriazlizer]))
+
+        models_path = models.__file__.replace('.pyc', '.py')
+        with open(models_path) as f:
+            source = f.read()
+        self.addCleanup(self._write, models_path, source)
+        self._write(models_path, source + '\n# changed\n')
+
+        self.assertNotEqual(fingerprint, Manifest(self.path).get_fingerprint(self.apis[0], [TestModelSeriazlizer]))
+
+    @staticmethod
+    def _write(path, content):
+        with open(path, 'w') as f:
+            f.write(content)
+
+    def test_changed_endpoint(self):
+        manifest = Manifest(self.path)
+        introspector = ApiIntrospector(self.apis, manifest)
+        introspector.inspect()
+        manifest._entries[manifest.get_key(self.apis[0])]['fingerprint'] = 'changed'
+
+        self.assertIsNone(manifest.get(self.apis[0]))
+        self.assertIsNotNone(manifest.get(self.apis[1]))
+
+    def test_copies(self):
+        manifest = Manifest(self.path)
+        ApiIntrospector(self.apis, manifest).inspect()
+
+        entry = manifest.get(self.apis[0])
+        entry['operations'].clear()
+        self.assertTrue(manifest.get(self.apis[0])['operations'])
+
+    def test_removed_endpoints(self):
+        manifest = Manifest(self.path)
+        ApiIntrospector(self.apis, manifest).inspect()
+        manifest.save()
+
+        manifest = Manifest(self.path)
+        manifest.load()
+        ApiIntrospector(self.apis[:1], manifest).inspect()
+        self.assertEqual(1, manifest.save())
+
+    def test_broken_file(self):
+        with open(self.path, 'w') as f:
+            f.write('broken')
+        self.assertEqual(0, Manifest(self.path).load())
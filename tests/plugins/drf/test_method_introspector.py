@@ -41,6 +41,13 @@ class BaseMethodIntrospectorTestCase(TestCase):
         view = self.method_introspector._create_view()
         self.assertTrue(isinstance(view, TestAPIView))
 
+    def test_shared_view(self):
+        view_introspector = self.method_introspector.introspector
+
+        self.assertIs(self.method_introspector.view, BaseMethodIntrospector(view_introspector, 'get').view)
+        self.assertIsNot(self.method_introspector.view, self.method_introspector_empty.view)
+        self.assertEqual('get', self.method_introspector.view.request.method)
+
     def test_method_callback(self):
         callback = self.method_introspector._method_callback()
         self.assertTrue(hasattr(callback, '__call__'))
@@ -185,6 +185,22 @@ class SerializerIntrospectorTestCase(TestCase):
 
         self.assertEqual(serializer_introspector.name, 'TestModelSeriazlizer')
 
+    def test_shared(self):
+        introspector = SerializerIntrospector.shared(TestModelSeriazlizer)
+
+        self.assertIs(introspector, SerializerIntrospector.shared(TestModelSeriazlizer()))
+        self.assertIs(introspector, SerializerIntrospector.shared(TestModelSeriazlizer(many=True)))
+        self.assertEqual('TestModelSeriazlizer', introspector.name)
+
+    def test_response_object_copy(self):
+        response = self.serializer_introspector.build_response_object()
+        response['schema'].pop('id')
+        response['schema']['properties'].clear()
+
+        response = self.serializer_introspector.build_response_object()
+        self.assertEqual('TestModelSeriazlizer', response['schema']['id'])
+        self.assertTrue(response['schema']['properties'])
+
     def test_response_object(self):
         response = self.serializer_introspector.build_response_object()
 
@@ -203,6 +219,14 @@ class SerializerIntrospectorTestCase(TestCase):
         self.assertIn('items', response)
         self.assertEqual(response['type'], 'array')
 
+    def test_fields_order(self):
+        serializer_fields = list(TestModelSeriazlizer().fields.keys())
+        fields = list(self.serializer_introspector.fields.keys())
+        self.assertEqual(serializer_fields, fields[:len(serializer_fields)])
+
+        schema = self.serializer_introspector.build_response_object(inline=True)['schema']
+        self.assertEqual([f for f in fields if f in schema['required']], schema['required'])
+
     def test_docstring_fields(self):
 
         self.assertIn('text_field', self.serializer_introspector.fields)
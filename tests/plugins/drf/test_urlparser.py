@@ -10,7 +10,7 @@ from rest_framework.routers import DefaultRouter
 from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet
 
-from py2swagger.plugins.drf.urlparser import UrlParser
+from py2swagger.plugins.drf.urlparser import PathFilter, UrlParser
 
 from testapp.serializers import CommentSerializer
 from testapp.urlparser import MockApiView, NonApiView
@@ -114,6 +114,32 @@ class UrlParserTest(TestCase):
 
         self.assertEqual(4, len(apis))
 
+    def test_format_api_patterns_with_include(self):
+        apis = self.urlparser.get_apis(self.url_patterns, include=['/a-view/*', 're:^/b-'])
+
+        paths = [api['path'] for api in apis]
+        self.assertEqual(['/a-view/', '/b-view', '/a-view/child/', '/a-view/child2/'], paths)
+
+    def test_format_api_patterns_with_exclude(self):
+        apis = self.urlparser.get_apis(self.url_patterns, filter_path='a-view', exclude=['*/child*'])
+
+        paths = [api['path'] for api in apis]
+        self.assertEqual(['/a-view/', '/a-view-honky/'], paths)
+
+    def test_format_api_patterns_prune(self):
+        urls = patterns(
+            '',
+            url(r'^api/', include(self.url_patterns)),
+            url(r'^other/', include(self.url_patterns)),
+        )
+        path_filter = PathFilter(include=['/api/a-view/*'])
+        self.assertFalse(path_filter.prune('/api/'))
+        self.assertTrue(path_filter.prune('/other/'))
+        self.assertTrue(PathFilter(exclude=['re:^/other/']).prune('/other/'))
+
+        apis = self.urlparser.get_apis(urls, include=['/api/a-view/*'])
+        self.assertEqual(3, len(apis))
+
     def test_format_api_patterns_excluded_namesapce(self):
         urls = patterns(
             '',
@@ -0,0 +1,25 @@
+import sys
+from unittest import TestCase
+
+from py2swagger.stats import stats
+
+from .benchmarks.generator import ProjectOptions
+from .benchmarks.runner import run_single
+
+
+class BenchmarkTestCase(TestCase):
+
+    def tearDown(self):
+        for name in ('simple_views', 'simple_config'):
+            sys.modules.pop(name, None)
+
+    def test_simple(self):
+        options = ProjectOptions(endpoints=3, serializers=2, depth=2, mixins=1, docstring_size=1)
+        result = run_single('simple', options)
+
+        self.assertEqual('simple', result['framework'])
+        self.assertEqual(3, result['counters']['paths'])
+        self.assertEqual(4, result['counters']['definitions'])
+        self.assertIn('introspection', result['phases'])
+        self.assertGreater(result['wall_time'], 0)
+        self.assertFalse(stats.enabled)
@@ -0,0 +1,134 @@
+import datetime
+import json
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from py2swagger.cache import DocstringCache, DiskDocstringCache, docstring_cache
+from py2swagger.yamlparser import YAMLDocstringParser
+
+
+class DocstringCacheTestCase(TestCase):
+
+    def setUp(self):
+        self.cache = DocstringCache(maxsize=2)
+
+    def test_get_set(self):
+        self.assertIsNone(self.cache.get('doc'))
+        self.assertEqual(1, self.cache.misses)
+
+        self.cache.set('doc', ('summary', None, {'k': 'v'}))
+        self.assertEqual(('summary', None, {'k': 'v'}), self.cache.get('doc'))
+        self.assertEqual(1, self.cache.hits)
+        self.assertIn('doc', self.cache)
+
+    def test_copy_on_read(self):
+        self.cache.set('doc', ('summary', None, {'parameters': [1]}))
+
+        _, _, schema = self.cache.get('doc')
+        schema['parameters'].append(2)
+
+        _, _, schema = self.cache.get('doc')
+        self.assertEqual([1], schema['parameters'])
+
+    def test_eviction(self):
+        self.cache.set('a', 1)
+        self.cache.set('b', 2)
+        self.cache.get('a')
+        self.cache.set('c', 3)
+
+        self.assertEqual(2, len(self.cache))
+        self.assertIn('a', self.cache)
+        self.assertNotIn('b', self.cache)
+        self.assertIn('c', self.cache)
+
+    def test_disabled(self):
+        cache = DocstringCache(maxsize=0)
+        cache.set('doc', 1)
+        self.assertEqual(0, len(cache))
+        self.assertIsNone(cache.get('doc'))
+
+    def test_clear(self):
+        self.cache.set('doc', 1)
+        self.cache.get('doc')
+        self.cache.clear()
+
+        self.assertEqual(0, len(self.cache))
+        self.assertEqual(0, self.cache.hits)
+        self.assertEqual(0, self.cache.misses)
+
+    def test_parser_uses_cache(self):
+        docstring = 'Cached summary\nCached description\n---\ntags:\n- tag'
+        docstring_cache.clear()
+
+        YAMLDocstringParser(docstring).get_tags().append('another')
+        parser = YAMLDocstringParser(docstring)
+
+        self.assertEqual('Cached summary', parser.get_summary())
+        self.assertEqual('Cached description', parser.get_description())
+        self.assertEqual(['tag'], parser.get_tags())
+        self.assertEqual(1, docstring_cache.hits)
+
+
+class DiskDocstringCacheTestCase(TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_save_load(self):
+        cache = DocstringCache()
+        cache.set('doc', ('summary', None, {'tags': ['tag']}))
+        self.assertEqual(1, DiskDocstringCache(self.cache_dir, cache).save())
+        self.assertTrue(os.path.exists(DiskDocstringCache(self.cache_dir, cache).path))
+
+        cache = DocstringCache()
+        self.assertEqual(1, DiskDocstringCache(self.cache_dir, cache).load())
+        self.assertEqual(('summary', None, {'tags': ['tag']}), cache.get('doc'))
+
+    def test_save_load_types(self):
+        value = ('summary', None, {'responses': {200: {'description': 'OK'}}, 'x': ({'__tuple__': 1}, [True, 1.5])})
+        cache = DocstringCache()
+        cache.set('doc', value)
+        cache.set('date', (None, None, {'default': datetime.date(2000, 1, 1)}))
+        self.assertEqual(1, DiskDocstringCache(self.cache_dir, cache).save())
+
+        with open(DiskDocstringCache(self.cache_dir, cache).path) as f:
+            self.assertTrue(json.load(f))
+
+        cache = DocstringCache()
+        self.assertEqual(1, DiskDocstringCache(self.cache_dir, cache).load())
+        self.assertEqual(value, cache.get('doc'))
+        self.assertNotIn('date', cache)
+
+    def test_max_entries(self):
+        cache = DocstringCache()
+        for doc in ('a', 'b', 'c'):
+            cache.set(doc, doc)
+        DiskDocstringCache(self.cache_dir, cache, max_entries=2).save()
+
+        cache = DocstringCache()
+        DiskDocstringCache(self.cache_dir, cache).load()
+        self.assertNotIn('a', cache)
+        self.assertIn('b', cache)
+        self.assertIn('c', cache)
+
+    def test_stale_files_removed(self):
+        stale_path = os.path.join(self.cache_dir, 'docstrings-stale.json')
+        open(stale_path, 'w').close()
+
+        DiskDocstringCache(self.cache_dir, DocstringCache()).save()
+        self.assertFalse(os.path.exists(stale_path))
+
+    def test_broken_file(self):
+        disk_cache = DiskDocstringCache(self.cache_dir, DocstringCache())
+        with open(disk_cache.path, 'w') as f:
+            f.write('broken')
+
+        self.assertEqual(0, disk_cache.load())
+
+    def test_missing_file(self):
+        self.assertEqual(0, DiskDocstringCache(os.path.join(self.cache_dir, 'missing'), DocstringCache()).load())
@@ -1,5 +1,6 @@
 from unittest import TestCase
-from py2swagger.introspector import BaseDocstringIntrospector
+from py2swagger.introspector import BaseDocstringIntrospector, FRAMEWORK_CLASSES, register_framework_classes, registry
+from py2swagger.yamlparser import EMPTY_PARSER
 
 
 class Parent(object):
@@ -107,6 +108,14 @@ def decorated_function(n):
     return n
 
 
+class Undocumented(object):
+    pass
+
+
+class SharedParsersIntrospector(BaseDocstringIntrospector):
+    shared_parsers = True
+
+
 class BaseDocstringIntrospectorTestCase(TestCase):
 
     def test_parsers(self):
@@ -181,3 +190,55 @@ class BaseDocstringIntrospectorTestCase(TestCase):
         self.assertEqual(1, len(security_definitions.keys()))
 
         self.assertEqual('Decorator Docstring', parser.get_summary())
+
+    def test_empty_parsers_shared(self):
+        introspector = BaseDocstringIntrospector(Undocumented)
+
+        for parser in introspector.parsers:
+            self.assertIs(EMPTY_PARSER, parser)
+
+    def test_framework_classes(self):
+        register_framework_classes(Parent)
+        try:
+            introspector = BaseDocstringIntrospector(Child)
+        finally:
+            FRAMEWORK_CLASSES.discard(Parent)
+
+        self.assertEqual(2, len(introspector.parameters))
+        self.assertEqual('Child Class Docstring', introspector.parser.get_summary())
+
+    def test_shared_layers(self):
+        introspector = BaseDocstringIntrospector(Child)
+
+        self.assertIs(introspector.parameters, introspector.parameters)
+        self.assertIs(introspector.responses, introspector.responses)
+        self.assertEqual('Child 200 response', introspector.responses[200]['description'])
+
+    def test_invalidate(self):
+        introspector = BaseDocstringIntrospector(Child)
+        parameters = introspector.parameters
+
+        introspector.invalidate()
+        self.assertIsNot(parameters, introspector.parameters)
+        self.assertEqual(parameters, introspector.parameters)
+
+    def test_get_copy(self):
+        introspector = BaseDocstringIntrospector(Child)
+
+        parameters = introspector.get_copy('parameters')
+        parameters[0]['name'] = 'changed'
+        parameters.append({'name': 'new_parameter'})
+
+        self.assertEqual(4, len(introspector.parameters))
+        self.assertEqual('parent_parameter', introspector.parameters[0]['name'])
+
+    def test_shared_parsers(self):
+        registry.clear()
+
+        first = SharedParsersIntrospector(Child)
+        second = SharedParsersIntrospector(Child)
+        self.assertIs(first.parsers, second.parsers)
+        self.assertEqual(1, len(registry))
+
+        self.assertIsNot(first.parsers, BaseDocstringIntrospector(Child).parsers)
+        self.assertIsNot(first.parsers, SharedParsersIntrospector(Parent).parsers)
@@ -0,0 +1,126 @@
+import gzip
+import json
+import threading
+from unittest import TestCase
+from wsgiref import util
+
+from six import BytesIO
+
+from py2swagger.middleware import SchemaMiddleware, parse_plugin_arguments, plugin_build
+from py2swagger.plugins import Py2SwaggerPlugin
+from py2swagger.plugins.simple import SimplePlugin
+
+
+def view():
+    """
+    View summary
+    ---
+    responses:
+      200:
+        description: OK
+    """
+
+
+class ArgumentsPlugin(Py2SwaggerPlugin):
+
+    def set_parser_arguments(self, parser):
+        parser.add_argument('settings')
+        parser.add_argument('--jobs', type=int, default=1)
+
+    def run(self, arguments, *args, **kwargs):
+        return {'paths': {'/{}'.format(arguments.settings): {}}}
+
+
+def app(environ, start_response):
+    start_response('200 OK', [('Content-Type', 'text/plain')])
+    return [b'app']
+
+
+class SchemaMiddlewareTestCase(TestCase):
+
+    def setUp(self):
+        self.builds = 0
+        self.middleware = SchemaMiddleware(app, self.build)
+
+    def build(self):
+        self.builds += 1
+        return {'swagger': '2.0'}
+
+    def request(self, middleware=None, **environ):
+        util.setup_testing_defaults(environ)
+        response = {}
+
+        def start_response(status, headers):
+            response['status'] = status
+            response['headers'] = dict(headers)
+
+        body = b''.join((middleware or self.middleware)(environ, start_response))
+        return response['status'], response['headers'], body
+
+    def test_schema(self):
+        status, headers, body = self.request(PATH_INFO='/swagger.json')
+
+        self.assertEqual('200 OK', status)
+        self.assertEqual({'swagger': '2.0'}, json.loads(body.decode('utf-8')))
+        self.assertEqual(str(len(body)), headers['Content-Length'])
+
+        self.request(PATH_INFO='/swagger.json')
+        self.assertEqual(1, self.builds)
+
+    def test_app(self):
+        self.assertEqual(('200 OK', {'Content-Type': 'text/plain'}, b'app'), self.request(PATH_INFO='/'))
+        self.assertEqual(0, self.builds)
+
+    def test_gzip(self):
+        status, headers, body = self.request(PATH_INFO='/swagger.json', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual('gzip', headers['Content-Encoding'])
+        self.assertEqual(b'{"swagger":"2.0"}', gzip.GzipFile(fileobj=BytesIO(body)).read())
+
+    def test_conditional_get(self):
+        _, headers, _ = self.request(PATH_INFO='/swagger.json')
+        status, _, body = self.request(PATH_INFO='/swagger.json', HTTP_IF_NONE_MATCH=headers['ETag'])
+
+        self.assertEqual('304 Not Modified', status)
+        self.assertEqual(b'', body)
+
+    def test_methods(self):
+        status, headers, body = self.request(PATH_INFO='/swagger.json', REQUEST_METHOD='HEAD')
+        self.assertEqual('200 OK', status)
+        self.assertEqual(b'', body)
+        self.assertNotEqual('0', headers['Content-Length'])
+
+        status, _, _ = self.request(PATH_INFO='/swagger.json', REQUEST_METHOD='POST')
+        self.assertEqual('405 Method Not Allowed', status)
+
+    def test_background(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def build():
+            started.set()
+            release.wait()
+            return {'swagger': '2.0'}
+
+        middleware = SchemaMiddleware(app, build, path='/schema', background=True)
+        self.assertTrue(started.wait(5))
+        release.set()
+
+        status, _, _ = self.request(middleware, PATH_INFO='/schema')
+        self.assertEqual('200 OK', status)
+
+    def test_plugin_build(self):
+        build = plugin_build(SimplePlugin(), swagger_settings={'title': 'Title'}, endpoints=[('/view', 'get', view)])
+
+        schema = build()
+        self.assertEqual('Title', schema['info']['title'])
+        self.assertEqual('View summary', schema['paths']['/view']['get']['summary'])
+        self.assertEqual(schema, build())
+
+    def test_plugin_arguments(self):
+        arguments = parse_plugin_arguments(ArgumentsPlugin(), ['project', '--jobs', '2'])
+        self.assertEqual(('project', 2), (arguments.settings, arguments.jobs))
+        self.assertEqual(1, parse_plugin_arguments(ArgumentsPlugin(), ['project']).jobs)
+        self.assertRaises(ValueError, parse_plugin_arguments, ArgumentsPlugin())
+
+        build = plugin_build(ArgumentsPlugin(), ['project'])
+        self.assertIn('/project', build()['paths'])
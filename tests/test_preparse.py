@@ -0,0 +1,67 @@
+from unittest import TestCase
+
+from py2swagger.cache import docstring_cache
+from py2swagger.introspector import BaseDocstringIntrospector
+from py2swagger.preparse import collect_docstrings, preparse_docstrings
+
+from .test_introspector import Child, decorated_function
+
+
+class View(object):
+    """
+    View Docstring
+    ---
+    tags:
+    - view
+    """
+
+    def get(self):
+        """
+        Get Docstring
+        ---
+        tags:
+        - get
+        """
+
+    def post(self):
+        """
+        Post docstring without yaml
+        """
+
+
+class PreparseTestCase(TestCase):
+
+    def setUp(self):
+        docstring_cache.clear()
+
+    def test_collect_class_docstrings(self):
+        docstrings = collect_docstrings([View, View])
+
+        self.assertEqual(2, len(docstrings))
+        self.assertTrue(docstrings[0].startswith('View Docstring'))
+        self.assertTrue(docstrings[1].startswith('Get Docstring'))
+
+    def test_collect_inherited_docstrings(self):
+        docstrings = collect_docstrings([Child])
+
+        self.assertEqual(2, len(docstrings))
+
+    def test_collect_function_docstrings(self):
+        docstrings = collect_docstrings([decorated_function, View().get])
+
+        self.assertEqual(3, len(docstrings))
+
+    def test_preparse_serial(self):
+        self.assertEqual(2, preparse_docstrings([Child], workers=1))
+        self.assertEqual(0, preparse_docstrings([Child], workers=1))
+
+        introspector = BaseDocstringIntrospector(Child)
+        self.assertEqual(4, len(introspector.parameters))
+        self.assertEqual(0, docstring_cache.misses)
+
+    def test_preparse_workers(self):
+        self.assertEqual(4, preparse_docstrings([decorated_function, View], workers=2))
+
+        introspector = BaseDocstringIntrospector(decorated_function)
+        self.assertEqual(4, len(introspector.parameters))
+        self.assertEqual(0, docstring_cache.misses)
@@ -1,10 +1,11 @@
 import os
+import sys
 import json
 import copy
 from unittest import TestCase
 
 from py2swagger import schema_builder
-from py2swagger.utils import update_settings
+from py2swagger.utils import OrderedDict, update_settings
 
 
 class SchemaBuilderTestCase(TestCase):
@@ -96,6 +97,76 @@ class SchemaBuilderTestCase(TestCase):
         self.assertIn({'type': 'object', 'id': 'ArraySchema'}, result)
         self.assertIn({'type': 'object', 'id': 'PropSchema'}, result)
 
+    def test_extract_deep_definitions(self):
+        depth = sys.getrecursionlimit() * 2
+        data = item = {}
+        for i in range(depth):
+            item['schema'] = {'id': 'Schema{}'.format(i), 'type': 'object', 'properties': {'child': {}}}
+            item = item['schema']['properties']['child']
+
+        result = schema_builder._extract_definitions([data])
+
+        self.assertEqual(depth, len(result))
+        self.assertEqual('Schema0', result[0]['id'])
+        self.assertEqual('Schema{}'.format(depth - 1), result[-1]['id'])
+        self.assertEqual({'$ref': '#/definitions/Schema0'}, data['schema'])
+        self.assertEqual({'$ref': '#/definitions/Schema2'}, result[1]['properties']['child'])
+
+    def test_extract_definitions_order(self):
+        data = [
+            {'schema': {'id': 'A', 'properties': {'b': {'schema': {'id': 'B'}}}}},
+            {'schema': {'id': 'C', 'items': {'schema': {'id': 'D'}}}},
+        ]
+
+        result = schema_builder._extract_definitions(data)
+        self.assertEqual(['A', 'B', 'C', 'D'], [d['id'] for d in result])
+
+    def test_definition_hash(self):
+        self.assertEqual(
+            schema_builder._get_definition_hash({'type': 'object', 'properties': {'a': {}, 'b': {}}}),
+            schema_builder._get_definition_hash({'properties': {'b': {}, 'a': {}}, 'type': 'object'}),
+        )
+        self.assertNotEqual(
+            schema_builder._get_definition_hash({'required': ['a', 'b']}),
+            schema_builder._get_definition_hash({'required': ['b', 'a']}),
+        )
+        self.assertTrue(schema_builder._get_definition_hash({1: 'a', 'b': 'c'}))
+
+    def test_interned_definitions(self):
+        user = OrderedDict([('type', 'object'), ('properties', {'name': {'type': 'string'}})])
+
+        def response(schema_id):
+            schema = copy.deepcopy(user)
+            schema['id'] = schema_id
+            return {'200': {'schema': schema}}
+
+        paths = OrderedDict([
+            ('/a', {'get': {'responses': response('User')}}),
+            ('/b', {'get': {'responses': response('User')}}),
+            ('/c', {'get': {'responses': response('Author')}}),
+        ])
+
+        builder = schema_builder.SchemaBuilder(paths=paths)
+        definitions = builder.schema['definitions']
+
+        self.assertEqual(['User', 'Author'], list(definitions))
+        self.assertEqual(user, definitions['User'])
+        self.assertIs(definitions['User'], definitions['Author'])
+        self.assertEqual({'$ref': '#/definitions/User'}, paths['/b']['get']['responses']['200']['schema'])
+        self.assertEqual({}, builder.conflicts)
+
+    def test_conflicting_definitions(self):
+        paths = OrderedDict([
+            ('/a', {'get': {'responses': {'200': {'schema': OrderedDict([('id', 'User'), ('type', 'object')])}}}}),
+            ('/b', {'get': {'responses': {'200': {'schema': OrderedDict([('id', 'User'), ('type', 'string')])}}}}),
+        ])
+
+        builder = schema_builder.SchemaBuilder(paths=paths)
+        definitions = builder.schema['definitions']
+
+        self.assertEqual({'type': 'object'}, definitions['User'])
+        self.assertEqual({'User': [{'type': 'string'}]}, builder.conflicts)
+
     def test_schema_builder(self):
         config = {
             'version': '42',
@@ -0,0 +1,130 @@
+import gzip
+import json
+import threading
+from unittest import TestCase
+
+from six import BytesIO
+from six.moves.urllib.error import HTTPError
+from six.moves.urllib.request import Request, urlopen
+
+from py2swagger.introspector import BaseDocstringIntrospector, registry
+from py2swagger.server import CachedSchema, SchemaServer, accepts_gzip, etag_matches, parse_address
+from py2swagger.stats import stats
+from py2swagger.utils import OrderedDict
+
+
+class CachedSchemaTestCase(TestCase):
+
+    def setUp(self):
+        self.builds = 0
+        self.schema = CachedSchema(self.build)
+
+    def build(self):
+        self.builds += 1
+        return OrderedDict([('swagger', '2.0'), ('info', {'version': str(self.builds)})])
+
+    def test_get(self):
+        content, gzip_content, etag = self.schema.get()
+
+        self.assertEqual(b'{"swagger":"2.0","info":{"version":"1"}}', content)
+        self.assertEqual(content, gzip.GzipFile(fileobj=BytesIO(gzip_content)).read())
+        self.assertTrue(etag.startswith('"'))
+
+        self.schema.get()
+        self.assertEqual(1, self.builds)
+
+    def test_rebuild(self):
+        etag = self.schema.etag
+        self.schema.rebuild()
+
+        self.assertEqual(2, self.builds)
+        self.assertNotEqual(etag, self.schema.etag)
+
+    def test_invalidate(self):
+        self.schema.get()
+        self.schema.invalidate()
+        self.assertEqual(1, self.builds)
+
+        self.schema.get()
+        self.assertEqual(2, self.builds)
+
+    def test_accepts_gzip(self):
+        self.assertTrue(accepts_gzip('gzip, deflate'))
+        self.assertTrue(accepts_gzip('deflate, gzip;q=0.5'))
+        self.assertTrue(accepts_gzip('*'))
+        self.assertFalse(accepts_gzip('gzip;q=0'))
+        self.assertFalse(accepts_gzip('deflate'))
+        self.assertFalse(accepts_gzip(None))
+
+    def test_etag_matches(self):
+        self.assertTrue(etag_matches('"a"', '"a"'))
+        self.assertTrue(etag_matches('"b", W/"a"', '"a"'))
+        self.assertTrue(etag_matches('*', '"a"'))
+        self.assertFalse(etag_matches('"b"', '"a"'))
+        self.assertFalse(etag_matches(None, '"a"'))
+
+    def test_parse_address(self):
+        self.assertEqual(('127.0.0.1', 8000), parse_address('8000'))
+        self.assertEqual(('0.0.0.0', 80), parse_address('0.0.0.0:80'))
+        self.assertRaises(ValueError, parse_address, 'localhost')
+
+
+class SchemaServerTestCase(TestCase):
+
+    def setUp(self):
+        self.schema = CachedSchema(lambda: {'swagger': '2.0'})
+        self.server = SchemaServer(self.schema, ('127.0.0.1', 0))
+        self.url = 'http://127.0.0.1:{}'.format(self.server.server_address[1])
+
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def request(self, path, method='GET', headers=None):
+        request = Request(self.url + path, headers=headers or {})
+        request.get_method = lambda: method
+        try:
+            return urlopen(request)
+        except HTTPError as e:
+            return e
+
+    def test_schema(self):
+        response = self.request('/swagger.json')
+        self.assertEqual(200, response.getcode())
+        self.assertEqual({'swagger': '2.0'}, json.loads(response.read().decode('utf-8')))
+        self.assertEqual(self.schema.etag, response.info()['ETag'])
+
+    def test_gzip(self):
+        response = self.request('/', headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual('gzip', response.info()['Content-Encoding'])
+        self.assertEqual(self.schema.gzip_content, response.read())
+
+    def test_not_modified(self):
+        response = self.request('/', headers={'If-None-Match': self.schema.etag})
+        self.assertEqual(304, response.getcode())
+
+    def test_reload(self):
+        def view():
+            """
+            Old summary
+            """
+
+        def build():
+            introspector = registry.get((BaseDocstringIntrospector, view), BaseDocstringIntrospector, view)
+            return {'summary': introspector.parser.get_summary()}
+
+        self.server.schema = CachedSchema(build)
+        self.assertEqual({'summary': 'Old summary'}, json.loads(self.request('/').read().decode('utf-8')))
+
+        view.__doc__ = 'New summary'
+        stats.counters['endpoints'] = 1
+        self.assertEqual(204, self.request('/reload', 'POST').getcode())
+        self.assertEqual({'summary': 'New summary'}, json.loads(self.request('/').read().decode('utf-8')))
+        self.assertNotIn('endpoints', stats.counters)
+
+        self.assertEqual(404, self.request('/reload').getcode())
+        self.assertEqual(404, self.request('/missing').getcode())
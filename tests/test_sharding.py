@@ -0,0 +1,99 @@
+import json
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from py2swagger.sharding import get_shard_name, rewrite_refs, shard_schema, write_shards
+from py2swagger.utils import OrderedDict
+
+
+class ShardingTestCase(TestCase):
+
+    def setUp(self):
+        ref = {'$ref': '#/definitions/User'}
+        self.schema = OrderedDict([
+            ('swagger', '2.0'),
+            ('info', {'title': 'API'}),
+            ('paths', OrderedDict([
+                ('/users/{id}', OrderedDict([
+                    ('parameters', [{'name': 'id', 'in': 'path'}]),
+                    ('get', {'tags': ['users'], 'responses': {'200': {'schema': ref}}}),
+                    ('delete', {'tags': ['admin'], 'responses': {}}),
+                ])),
+                ('/groups', {'get': {'responses': {'200': {'schema': {'type': 'array', 'items': ref}}}}}),
+            ])),
+            ('definitions', {'User': {'type': 'object'}}),
+            ('securityDefinitions', {}),
+        ])
+
+    def test_get_shard_name(self):
+        self.assertEqual('users', get_shard_name('/x', {'tags': ['users', 'other']}))
+        self.assertEqual('default', get_shard_name('/x', {}))
+        self.assertEqual('users', get_shard_name('/users/{id}', {}, 'prefix'))
+        self.assertEqual('default', get_shard_name('/{id}/', {}, 'prefix'))
+
+    def test_rewrite_refs(self):
+        value = {'items': [{'$ref': '#/definitions/A'}], '$ref': 'other.json#/definitions/B'}
+        result = rewrite_refs(value, 'definitions.json')
+
+        self.assertEqual('definitions.json#/definitions/A', result['items'][0]['$ref'])
+        self.assertEqual('other.json#/definitions/B', result['$ref'])
+        self.assertEqual('#/definitions/A', value['items'][0]['$ref'])
+
+    def test_shard_by_tag(self):
+        documents = shard_schema(self.schema)
+
+        self.assertEqual(['index.json', 'definitions.json', 'users.json', 'admin.json', 'default.json'],
+                         list(documents))
+        self.assertEqual({'User': {'type': 'object'}}, documents['definitions.json']['definitions'])
+
+        users = documents['users.json']
+        self.assertEqual(['parameters', 'get'], list(users['paths']['/users/{id}']))
+        self.assertEqual('definitions.json#/definitions/User',
+                         users['paths']['/users/{id}']['get']['responses']['200']['schema']['$ref'])
+        self.assertNotIn('definitions', users)
+        self.assertEqual('2.0', users['swagger'])
+
+        index = documents['index.json']
+        self.assertEqual('definitions.json', index['definitions'])
+        self.assertEqual(
+            [('users', 'users.json', ['/users/{id}']), ('admin', 'admin.json', ['/users/{id}']),
+             ('default', 'default.json', ['/groups'])],
+            [(s['name'], s['file'], s['paths']) for s in index['shards']]
+        )
+
+    def test_shard_uppercase_methods(self):
+        schema = OrderedDict([
+            ('paths', {'/hello': OrderedDict([('parameters', []), ('GET', {'tags': ['hello'], 'responses': {}})])}),
+        ])
+        documents = shard_schema(schema)
+
+        self.assertEqual(['index.json', 'definitions.json', 'hello.json'], list(documents))
+        self.assertEqual(['parameters', 'GET'], list(documents['hello.json']['paths']['/hello']))
+        self.assertEqual(['/hello'], documents['index.json']['shards'][0]['paths'])
+
+    def test_shard_by_prefix(self):
+        documents = shard_schema(self.schema, 'prefix', '.yaml')
+        self.assertEqual(['index.yaml', 'definitions.yaml', 'users.yaml', 'groups.yaml'], list(documents))
+        self.assertEqual(['parameters', 'get', 'delete'], list(documents['users.yaml']['paths']['/users/{id}']))
+
+    def test_file_names(self):
+        self.schema['paths']['/groups']['get']['tags'] = ['index']
+        self.schema['paths']['/users/{id}']['delete']['tags'] = ['user/admin']
+        documents = shard_schema(self.schema)
+        self.assertEqual(['index.json', 'definitions.json', 'users.json', 'user_admin.json', 'index_2.json'],
+                         list(documents))
+
+    def test_unknown_shard_key(self):
+        self.assertRaises(ValueError, shard_schema, self.schema, 'method')
+
+    def test_write_shards(self):
+        directory = os.path.join(tempfile.mkdtemp(), 'shards')
+        self.addCleanup(shutil.rmtree, os.path.dirname(directory))
+
+        written = write_shards(self.schema, directory, gzip_copy=True)
+
+        self.assertEqual(10, len(written))
+        with open(os.path.join(directory, 'users.json')) as f:
+            self.assertEqual(['/users/{id}'], list(json.load(f)['paths']))
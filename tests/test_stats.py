@@ -0,0 +1,61 @@
+from unittest import TestCase
+
+from py2swagger.stats import Stats
+
+
+class StatsTestCase(TestCase):
+
+    def setUp(self):
+        self.stats = Stats()
+        self.stats.enabled = True
+
+    def test_disabled(self):
+        stats = Stats()
+        with stats.timer('phase'):
+            stats.incr('counter')
+
+        self.assertEqual({}, stats.timings)
+        self.assertEqual({}, stats.counters)
+
+    def test_timer(self):
+        with self.stats.timer('phase'):
+            with self.stats.timer('nested'):
+                pass
+        with self.stats.timer('phase'):
+            pass
+
+        self.assertEqual(['phase', 'nested'], list(self.stats.timings.keys()))
+        self.assertTrue(self.stats.timings['phase'] >= self.stats.timings['nested'])
+
+    def test_recursive_timer(self):
+        with self.stats.timer('phase'):
+            with self.stats.timer('phase'):
+                self.stats.add_time('phase', 0)
+        self.stats.add_time('other', 10)
+
+        self.assertTrue(self.stats.timings['phase'] < 10)
+
+    def test_counters(self):
+        self.stats.incr('counter')
+        self.stats.incr('counter', 2)
+        self.stats.set('value', 42)
+
+        self.assertEqual(3, self.stats.counters['counter'])
+        self.assertEqual(42, self.stats.counters['value'])
+
+    def test_report(self):
+        self.stats.add_time('phase', 1.5)
+        self.stats.incr('counter')
+
+        report = self.stats.report()
+        self.assertIn('phase', report)
+        self.assertIn('1.500s', report)
+        self.assertIn('counter', report)
+
+    def test_reset(self):
+        self.stats.add_time('phase', 1)
+        self.stats.incr('counter')
+        self.stats.reset()
+
+        self.assertEqual({}, self.stats.timings)
+        self.assertEqual({}, self.stats.counters)
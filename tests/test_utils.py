@@ -219,7 +219,7 @@ class Py2SwaggerUtilsTestCase(TestCase):
         c: 3
         """
 
-        result = utils.yaml.load(data)
+        result = utils.YAMLLoaderMixin.yaml_load(data)
 
         self.assertTrue(isinstance(result, utils.OrderedDict))
         self.assertEqual(['a', 'b', 'c'], list(result.keys()))
@@ -231,6 +231,69 @@ class Py2SwaggerUtilsTestCase(TestCase):
         index_c = result.index('c')
         self.assertTrue(index_a < index_b < index_c)
 
+    def test_yaml_load_safe(self):
+        self.assertIsNone(utils.YAMLLoaderMixin.yaml_load('!!python/object:os.system {}'))
+        self.assertIn(utils.YAMLLoaderMixin.yaml_engine, ('libyaml', 'python'))
+
+    def test_list_layers(self):
+        layers = utils.ListLayers([[1, 2], [], [3]])
+
+        self.assertEqual(3, len(layers))
+        self.assertEqual([1, 2, 3], list(layers))
+        self.assertEqual([1, 2, 3], layers)
+        self.assertNotEqual([1, 2], layers)
+        self.assertEqual(3, layers[2])
+        self.assertEqual(3, layers[-1])
+        self.assertEqual([2, 3], layers[1:])
+        self.assertRaises(IndexError, lambda: layers[3])
+        self.assertFalse(utils.ListLayers([[], []]))
+
+    def test_dict_layers(self):
+        first = utils.OrderedDict([('a', 1), ('b', 2)])
+        second = utils.OrderedDict([('c', 3), ('a', 4)])
+        layers = utils.DictLayers([first, {}, second])
+
+        self.assertEqual(['a', 'b', 'c'], list(layers.keys()))
+        self.assertEqual(4, layers['a'])
+        self.assertEqual(2, layers['b'])
+        self.assertIn('c', layers)
+        self.assertEqual({'a': 4, 'b': 2, 'c': 3}, layers)
+        self.assertRaises(KeyError, lambda: layers['d'])
+        self.assertEqual(1, first['a'])
+
+    def test_memoized_property(self):
+        class Parent(object):
+            calls = 0
+
+            @utils.memoized_property
+            def value(self):
+                self.calls += 1
+                return [self.calls]
+
+        class Child(Parent):
+            @utils.memoized_property
+            def value(self):
+                return super(Child, self).value + ['child']
+
+        instance = Child()
+        self.assertEqual([1, 'child'], instance.value)
+        self.assertIs(instance.value, instance.value)
+        self.assertEqual(1, instance.calls)
+
+        instance.__dict__.pop('_memoized')
+        self.assertEqual([2, 'child'], instance.value)
+
+    def test_merge_layers(self):
+        self.assertEqual([1], utils.merge_layers([[1]]))
+        self.assertEqual('first', utils.merge_layers(['first', 'second']))
+        self.assertEqual([1, 2], utils.merge_layers([[1], {'a': 1}, [2]]))
+        self.assertEqual({'a': 2}, utils.merge_layers([{'a': 1}, [1], {'a': 2}]))
+
+    def test_materialize(self):
+        self.assertTrue(isinstance(utils.materialize(utils.ListLayers([[1]])), list))
+        self.assertTrue(isinstance(utils.materialize(utils.DictLayers([{'a': 1}])), utils.OrderedDict))
+        self.assertEqual('value', utils.materialize('value'))
+
     def test_update_settings(self):
         config = {
             'version': '42',
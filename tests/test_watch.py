@@ -0,0 +1,85 @@
+import os
+import shutil
+import sys
+import tempfile
+from importlib import import_module
+from unittest import TestCase
+
+from py2swagger.watch import ModuleWatcher, watch
+
+
+class ModuleWatcherTestCase(TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.mtime_shift = 0
+        self.write('watched_base.py', 'VALUE = 1\n')
+        self.write('watched_view.py', 'from watched_base import VALUE\nimport watched_base\n')
+        self.write('watched_other.py', 'VALUE = 2\n')
+
+        sys.path.insert(0, self.root)
+        for name in ('watched_base', 'watched_view', 'watched_other'):
+            import_module(name)
+
+        self.watcher = ModuleWatcher(self.root, interval=0)
+
+    def tearDown(self):
+        sys.path.remove(self.root)
+        for name in ('watched_base', 'watched_view', 'watched_other'):
+            sys.modules.pop(name, None)
+        shutil.rmtree(self.root)
+
+    def write(self, name, content):
+        path = os.path.join(self.root, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        # make change visible regardless of file system timestamps resolution
+        self.mtime_shift += 10
+        mtime = os.stat(path).st_mtime + self.mtime_shift
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def test_poll(self):
+        self.assertEqual(set(), self.watcher.poll())
+
+        path = self.write('watched_base.py', 'VALUE = 3\n')
+        self.assertEqual({path}, self.watcher.poll())
+        self.assertEqual(set(), self.watcher.poll())
+
+        os.remove(path)
+        self.assertEqual({path}, self.watcher.poll())
+
+    def test_project_modules(self):
+        modules = self.watcher.get_project_modules()
+        self.assertEqual({'watched_base', 'watched_view', 'watched_other'}, set(modules))
+
+    def test_affected_modules(self):
+        path = os.path.join(self.root, 'watched_base.py')
+        self.assertEqual(['watched_base', 'watched_view'], self.watcher.get_affected_modules([path]))
+
+        path = os.path.join(self.root, 'watched_view.py')
+        self.assertEqual(['watched_view'], self.watcher.get_affected_modules([path]))
+
+    def test_reload(self):
+        path = self.write('watched_base.py', 'VALUE = 3\n')
+
+        self.assertEqual(['watched_base', 'watched_view'], self.watcher.reload([path]))
+        self.assertEqual(3, sys.modules['watched_view'].VALUE)
+
+    def test_watch(self):
+        builds = []
+
+        def build():
+            builds.append(sys.modules['watched_view'].VALUE)
+            if len(builds) == 1:
+                raise ValueError('build errors are logged')
+
+        def stop():
+            if not builds:
+                self.write('watched_base.py', 'VALUE = 3\n')
+            elif len(builds) == 1:
+                self.write('watched_base.py', 'VALUE = 5\n')
+            return len(builds) >= 2
+
+        watch(build, self.root, interval=0, stop=stop)
+        self.assertEqual([3, 5], builds)
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import gzip
+import json
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+import yaml
+from six import BytesIO, StringIO
+
+from py2swagger.schema_builder import SchemaBuilder
+from py2swagger.utils import OrderedDict
+from py2swagger.writer import iterencode, write_gzip_copy, write_json, write_schema
+
+
+class WriterTestCase(TestCase):
+
+    def setUp(self):
+        with open(os.path.join(os.path.dirname(__file__), 'datamap.json')) as f:
+            paths = json.load(f, object_pairs_hook=OrderedDict)
+        self.schema = SchemaBuilder(paths=paths, description=u'Сервис').schema
+
+    def test_iterencode(self):
+        self.assertEqual(json.dumps(self.schema, indent=2, separators=(',', ': ')), ''.join(iterencode(self.schema)))
+        self.assertEqual(json.dumps(self.schema, indent=4, separators=(',', ': ')), ''.join(iterencode(self.schema, indent=4)))
+        self.assertEqual(json.dumps(self.schema, separators=(',', ':')), ''.join(iterencode(self.schema, compact=True)))
+
+    def test_iterencode_empty(self):
+        schema = OrderedDict([('paths', {}), ('definitions', OrderedDict([(1, {}), ('a', [])]))])
+        self.assertEqual(json.dumps(schema, indent=2, separators=(',', ': ')), ''.join(iterencode(schema)))
+        self.assertEqual('{}', ''.join(iterencode({})))
+
+    def test_iterencode_chunks(self):
+        chunks = list(iterencode(self.schema))
+        self.assertGreater(len(chunks), len(self.schema) + len(self.schema['paths']))
+
+    def test_write_json(self):
+        stream = StringIO()
+        write_json(self.schema, stream, chunk_size=10)
+        self.assertEqual(json.dumps(self.schema, indent=2, separators=(',', ': ')), stream.getvalue())
+
+        stream = StringIO()
+        write_json(self.schema, stream, compact=True)
+        self.assertEqual(self.schema, json.loads(stream.getvalue()))
+
+    def test_write_schema(self):
+        for streaming in (False, True):
+            stream = BytesIO()
+            write_schema(self.schema, stream, streaming=streaming)
+            self.assertEqual(json.dumps(self.schema, indent=2, separators=(',', ': ')).encode('utf-8'), stream.getvalue())
+
+            stream = BytesIO()
+            write_schema(self.schema, stream, 'compact', streaming)
+            self.assertEqual(json.dumps(self.schema, separators=(',', ':')).encode('utf-8'), stream.getvalue())
+
+            stream = BytesIO()
+            write_schema(self.schema, stream, 'gzip', streaming)
+            data = gzip.GzipFile(fileobj=BytesIO(stream.getvalue())).read()
+            self.assertEqual(json.dumps(self.schema, separators=(',', ':')).encode('utf-8'), data)
+
+    def test_write_yaml(self):
+        self.schema['definitions']['Copy'] = self.schema['definitions']['Shared'] = {'type': 'object'}
+
+        stream = BytesIO()
+        write_schema(self.schema, stream, 'yaml')
+        data = stream.getvalue().decode('utf-8')
+
+        self.assertTrue(data.startswith('swagger: '))
+        self.assertNotIn('&id', data)
+        self.assertIn(u'Сервис', data)
+        self.assertEqual(json.loads(json.dumps(self.schema)), yaml.safe_load(data))
+
+    def test_unknown_format(self):
+        self.assertRaises(ValueError, write_schema, self.schema, BytesIO(), 'xml')
+
+    def test_write_gzip_copy(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+
+        path = os.path.join(tmp_dir, 'swagger.json')
+        with open(path, 'wb') as f:
+            write_schema(self.schema, f)
+
+        self.assertEqual(path + '.gz', write_gzip_copy(path))
+        with open(path, 'rb') as f, gzip.open(path + '.gz', 'rb') as gzip_file:
+            self.assertEqual(f.read(), gzip_file.read())
@@ -1,5 +1,6 @@
 from unittest import TestCase
-from py2swagger.yamlparser import YAMLDocstringParser
+from py2swagger.cache import docstring_cache
+from py2swagger.yamlparser import YAMLDocstringParser, FrozenYAMLDocstringParser, EMPTY_PARSER
 
 
 class YAMLDocstringParserTestCase(TestCase):
@@ -276,3 +277,37 @@ class YAMLDocstringParserTestCase(TestCase):
         # Check serializer updated
         request_serializer = parser.get_request_serializer()
         self.assertEqual('path.to.new.RequestSerializer', request_serializer)
+
+    def test_docstring_without_yaml(self):
+        parser = YAMLDocstringParser("""
+        Summary
+        Description
+        """)
+
+        self.assertEqual('Summary', parser.get_summary())
+        self.assertEqual('Description', parser.get_description())
+        self.assertEqual(dict(), parser.schema)
+
+    def test_frozen_parser(self):
+        parser = FrozenYAMLDocstringParser(self.docstring)
+        self.assertEqual(2, len(parser.get_tags()))
+        self.assertRaises(TypeError, parser.update, self.docstring)
+
+        self.assertEqual(dict(), EMPTY_PARSER.schema)
+        self.assertIsNone(EMPTY_PARSER.get_summary())
+
+    def test_lazy_schema(self):
+        docstring_cache.clear()
+        parser = YAMLDocstringParser(self.docstring)
+        parser.update("""
+        New summary
+        ---
+        tags:
+        - tag3
+        """)
+
+        self.assertEqual('New summary', parser.get_summary())
+        self.assertEqual(0, docstring_cache.misses)
+
+        self.assertEqual(['tag1', 'tag2', 'tag3'], parser.get_tags())
+        self.assertEqual(2, docstring_cache.misses)